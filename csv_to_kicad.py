@@ -11,8 +11,11 @@ import csv
 import re
 from enum import Enum
 from collections import namedtuple
-from dataclasses import dataclass, field
-from typing import Optional, Tuple, Union, TypeAlias
+from dataclasses import dataclass, field, replace
+from functools import cache
+from itertools import islice
+from types import MappingProxyType
+from typing import Callable, Optional, Tuple, Union, TypeAlias
 
 import kicad_sym as kicad
 
@@ -39,6 +42,7 @@ determines the required symbol size, and outputs the KiCad library. The script
 supports the creation of symbols with one functional unit.'''
 
     @classmethod
+    @cache
     def more_doc(cls) -> str:
         return '\n' + cls.DOC
 
@@ -58,38 +62,58 @@ class Need(Enum):
 
 NEED_DESCR = ['Optional', 'Mandatory', 'Value required']
 
-ColumnProp = namedtuple('ColumnProp', 'name need')
+def column_type_descr(name:str, bool_fields:frozenset[str],
+                      int_fields:frozenset[str],
+                      float_fields:frozenset[str]) -> str:
+    """Return the type name of a column for the documentation.
+
+    The order of the checks is the same as in get_converter."""
+    if name in bool_fields:
+        return 'boolean'
+    elif name in int_fields:
+        return 'integer'
+    elif name in float_fields:
+        return 'float'
+    else:
+        return 'string'
+
+@dataclass(slots=True, frozen=True)
+class ColumnProp:
+    """Name and necessity of a column."""
+    name: str
+    need: Need
 
 
 class SymHead:
     """Class contains information of the symbol columns."""
     # The possible column header entries
-    NAME = 'symbol name'
-    REFERENCE = 'reference'
-    FOOTPRINT = 'footprint'
-    DATASHEET = 'datasheet'
-    DESCRIPTION = 'description'
-    KEYWORDS = 'keywords'
-    FP_FILTERS = 'fp filters'
-    EXTENDS = 'extends'
-    TEXT = 'text'               # TEXT - The TEXT field in the symbol
-    IN_BOM = 'in bom'
-    ON_BOARD = 'on board'
-    PIN_NUMBERS_HIDE = 'hide pin numbers'
-    PIN_NAME_OFFSET = 'pin name offset'
-    PIN_NAMES_HIDE = 'hide pin names'
-    MIN_W = 'min width'  # min width of the pin shape rect. in pin grid units (must be even)
-    MIN_H = 'min height' # min height ...
-    W_PADDING = 'w padding' # padding of the body rectangle in pin grid units
-    H_PADDING = 'h padding' # fractions possible
-    TEXT_FONT_SIZE = 'text font size' # Font size for text boxes 50 mills
-    TEXT_GAP = 'text gap'
-    H_REF_VALUE_GAP = 'h r/v gap'
-    W_REF_VALUE_PIN_GAP = 'w r/v gap'
-    DERIVE_FROM = 'derive from'
+    # Interned because they are the dict keys of every header/column lookup
+    NAME = sys.intern('symbol name')
+    REFERENCE = sys.intern('reference')
+    FOOTPRINT = sys.intern('footprint')
+    DATASHEET = sys.intern('datasheet')
+    DESCRIPTION = sys.intern('description')
+    KEYWORDS = sys.intern('keywords')
+    FP_FILTERS = sys.intern('fp filters')
+    EXTENDS = sys.intern('extends')
+    TEXT = sys.intern('text')               # TEXT - The TEXT field in the symbol
+    IN_BOM = sys.intern('in bom')
+    ON_BOARD = sys.intern('on board')
+    PIN_NUMBERS_HIDE = sys.intern('hide pin numbers')
+    PIN_NAME_OFFSET = sys.intern('pin name offset')
+    PIN_NAMES_HIDE = sys.intern('hide pin names')
+    MIN_W = sys.intern('min width')  # min width of the pin shape rect. in pin grid units (must be even)
+    MIN_H = sys.intern('min height') # min height ...
+    W_PADDING = sys.intern('w padding') # padding of the body rectangle in pin grid units
+    H_PADDING = sys.intern('h padding') # fractions possible
+    TEXT_FONT_SIZE = sys.intern('text font size') # Font size for text boxes 50 mills
+    TEXT_GAP = sys.intern('text gap')
+    H_REF_VALUE_GAP = sys.intern('h r/v gap')
+    W_REF_VALUE_PIN_GAP = sys.intern('w r/v gap')
+    DERIVE_FROM = sys.intern('derive from')
 
     # internally used
-    VALUE = 'symbol value'
+    VALUE = sys.intern('symbol value')
 
     # this is a list because the order matters during symbol parsing
     COLUMNS_NEED = [
@@ -106,9 +130,10 @@ class SymHead:
         ColumnProp(TEXT_FONT_SIZE, Need.OPT),  ColumnProp(TEXT_GAP, Need.OPT),
         ColumnProp(H_REF_VALUE_GAP, Need.OPT), ColumnProp(W_REF_VALUE_PIN_GAP, Need.OPT)]
 
-    BOOL_FIELDS = {IN_BOM, ON_BOARD, PIN_NUMBERS_HIDE, PIN_NAMES_HIDE}
-    FLOAT_FIELDS = {W_PADDING, H_PADDING, TEXT_GAP, H_REF_VALUE_GAP, W_REF_VALUE_PIN_GAP}
-    INT_FIELDS = {PIN_NAME_OFFSET, MIN_W, MIN_H, TEXT_FONT_SIZE}
+    BOOL_FIELDS = frozenset({IN_BOM, ON_BOARD, PIN_NUMBERS_HIDE, PIN_NAMES_HIDE})
+    FLOAT_FIELDS = frozenset({W_PADDING, H_PADDING, TEXT_GAP, H_REF_VALUE_GAP,
+                              W_REF_VALUE_PIN_GAP})
+    INT_FIELDS = frozenset({PIN_NAME_OFFSET, MIN_W, MIN_H, TEXT_FONT_SIZE})
 
     DEFAULTS = {REFERENCE: 'U',
                 IN_BOM: 'yes',
@@ -133,10 +158,10 @@ class SymHead:
     MAN_PROPS = [REFERENCE, VALUE, DESCRIPTION, DATASHEET, FOOTPRINT, KEYWORDS]
     OPT_PROPS = [FP_FILTERS]
     # Hidden text fields to shift away from 0, 0
-    HIDDEN_PROPS_TO_SHIFT = {DESCRIPTION, DATASHEET, FOOTPRINT}
+    HIDDEN_PROPS_TO_SHIFT = frozenset({DESCRIPTION, DATASHEET, FOOTPRINT})
     # Properties valid for extension symbols (except name & extends)
-    EXTENSION_PROPS = {REFERENCE, FOOTPRINT, DATASHEET, DESCRIPTION, KEYWORDS,
-                       FP_FILTERS}
+    EXTENSION_PROPS = frozenset({REFERENCE, FOOTPRINT, DATASHEET, DESCRIPTION,
+                                 KEYWORDS, FP_FILTERS})
     
     INFO = {
         TEXT: 'The text field in the main symbol rectangle',
@@ -164,76 +189,79 @@ class SymHead:
         'or inserted. New pins can be inserted or appended.'
     }
 
-    @classmethod
-    def more_doc(cls) -> str:
-        res = \
+    DOC_HEAD = \
 '''\nThe first line in the symbol csv file is the headline for the symbol description.
 The first column of the first line must be not empty. It must be a mandatory symbol
 attribute like "symbol name". Header entries are case insensitive. Each column head
-is associated with an "Need". The needs are:\n\n'''
-        res += Need.__doc__
-        res += '\n\nThe following columns are defined for the symbol description:\n\n'
-        for item in cls.COLUMNS_NEED:
-            if item.name in cls.BOOL_FIELDS:
-                the_type = 'boolean'
-            elif item.name in cls.FLOAT_FIELDS:
-                the_type = 'float'
-            elif item.name in cls.INT_FIELDS:
-                the_type = 'integer'
-            else:
-                the_type = 'string'
-            if item.name in cls.DEFAULTS:
-                default = cls.DEFAULTS[item.name]
-            else:
-                default = 'no default'
-            res += f'{item.name.title()} --\t{NEED_DESCR[item.need.value]}  '\
-                f'Type:{the_type}  Default: {default}\n'
-            if item.name in cls.INFO:
-                res += cls.INFO[item.name] + '\n'
-            res += '\n'
-        res += f'A pin grid unit is {Const.GRID} mm\n'
-        return res
+is associated with an "Need". The needs are:\n\n''' + Need.__doc__ + \
+'\n\nThe following columns are defined for the symbol description:\n\n'
+    DOC_TAIL = f'A pin grid unit is {Const.GRID} mm\n'
+
+    @classmethod
+    def column_doc(cls, item:ColumnProp) -> str:
+        """Return the documentation of one symbol column."""
+        the_type = column_type_descr(item.name, cls.BOOL_FIELDS, cls.INT_FIELDS,
+                                     cls.FLOAT_FIELDS)
+        default = cls.DEFAULTS.get(item.name, 'no default')
+        res = f'{item.name.title()} --\t{NEED_DESCR[item.need.value]}  '\
+            f'Type:{the_type}  Default: {default}\n'
+        if item.name in cls.INFO:
+            res += cls.INFO[item.name] + '\n'
+        return res + '\n'
+
+    @classmethod
+    @cache
+    def more_doc(cls) -> str:
+        return cls.DOC_HEAD + ''.join(map(cls.column_doc, cls.COLUMNS_NEED)) + cls.DOC_TAIL
+
+    @classmethod
+    @cache
+    def man_props_meta(cls) -> Tuple[Tuple[str,str,bool],...]:
+        """Return (kicad name, column, is shifted) of all mandatory properties."""
+        return tuple((cls.KICAD_PROPERTY_NAMES[p], p, p in cls.HIDDEN_PROPS_TO_SHIFT)
+                     for p in cls.MAN_PROPS)
+
+    @classmethod
+    @cache
+    def opt_props_meta(cls) -> Tuple[Tuple[str,str],...]:
+        """Return (kicad name, column) of all optional properties."""
+        return tuple((cls.KICAD_PROPERTY_NAMES[p], p) for p in cls.OPT_PROPS)
 
 
 class PinHead:
     """Class describing the pin columns."""
 
     GAP = '---'        # special number for single gap in the pin row
-    GAP_REX_ANY = r'---+.*' 
-    GAP_REX_N1 = r'---+$'
-    GAP_REX_N = r'---+\s*(\d+)$'
+    GAP_REX_N1 = re.compile(r'---+$')
+    GAP_REX_N = re.compile(r'---+\s*(\d+)$')
 
     def is_gap(value:str) -> bool:
-        the_match = re.match(PinHead.GAP_REX_ANY, value)
-        if the_match:
-            return True
-        else:
-            return False
+        return value.startswith(PinHead.GAP)
     
     def get_gap_count(value:str) -> Optional[int]:
         res = None
-        the_match = re.match(PinHead.GAP_REX_N, value)
-        if the_match:
-            res = int(the_match.group(1))
-            if res < 1:
-                res = None
-        else:
-            the_match = re.match(PinHead.GAP_REX_N1, value)
+        if value.startswith(PinHead.GAP):
+            the_match = PinHead.GAP_REX_N.match(value)
             if the_match:
+                res = int(the_match.group(1))
+                if res < 1:
+                    res = None
+            elif PinHead.GAP_REX_N1.match(value):
                 res = 1
-        vpr(f'get_gap_count({value}) returns: {res}', level=Verbosity.VERY_VERB)
+        if very_verbose:
+            vpr(f'get_gap_count({value}) returns: {res}', level=Verbosity.VERY_VERB)
         return res
 
-    CAT = 'pin category'
-    NAME = 'pin name'
-    NUMBER = 'pin number'
-    GR_TYPE = 'pin gr type'
-    EL_TYPE = 'pin el type'
-    LEN = 'pin length'
-    STACKED = 'pin stacked'
-    HIDDEN = 'pin hidden'
-    NAME_FONT_SIZE = 'name font size'
-    NUMBER_FONT_SIZE = 'number font size'
+    CAT = sys.intern('pin category')
+    NAME = sys.intern('pin name')
+    NUMBER = sys.intern('pin number')
+    GR_TYPE = sys.intern('pin gr type')
+    EL_TYPE = sys.intern('pin el type')
+    LEN = sys.intern('pin length')
+    STACKED = sys.intern('pin stacked')
+    HIDDEN = sys.intern('pin hidden')
+    NAME_FONT_SIZE = sys.intern('name font size')
+    NUMBER_FONT_SIZE = sys.intern('number font size')
 
     # this is a list because the order matters during pin parsing
     COLUMNS_NEED = [
@@ -244,12 +272,18 @@ class PinHead:
         ColumnProp(NAME_FONT_SIZE, Need.OPT),
         ColumnProp(NUMBER_FONT_SIZE, Need.OPT)]
 
+    # The Pin attribute (slot) which stores the column value
+    ATTRIBUTES = {CAT: 'cat', NUMBER: 'number', NAME: 'name', GR_TYPE: 'gr_type',
+                  EL_TYPE: 'el_type', STACKED: 'stacked', HIDDEN: 'hidden',
+                  LEN: 'length', NAME_FONT_SIZE: 'name_font_size',
+                  NUMBER_FONT_SIZE: 'number_font_size'}
+
     STICKY_FIELDS = frozenset({CAT, GR_TYPE, EL_TYPE, LEN, NAME_FONT_SIZE,
                                NUMBER_FONT_SIZE})
 
-    BOOL_FIELDS = {STACKED, HIDDEN}
-    FLOAT_FIELDS = {LEN, NAME_FONT_SIZE, NUMBER_FONT_SIZE}
-    INT_FIELDS = {}
+    BOOL_FIELDS = frozenset({STACKED, HIDDEN})
+    FLOAT_FIELDS = frozenset({LEN, NAME_FONT_SIZE, NUMBER_FONT_SIZE})
+    INT_FIELDS = frozenset()
 
     DEFAULTS = {
         GR_TYPE: 'line',
@@ -259,35 +293,37 @@ class PinHead:
         }
 
     SIDE_TO_ANGLE = {'left': 0, 'right': 180, 'bottom': 90, 'top': 270}
+    # direction of the pin connection point from the body edge per rotation
+    ANGLE_TO_OFFSET = {0: (-1, 0), 180: (1, 0), 270: (0, 1), 90: (0, -1)}
 
     DELETE = 'delete'
     BEFORE = 'before'
     AFTER = 'after'
     OVERLOAD = 'overload'
-    CATS_FOR_DERIVED = {DELETE, BEFORE, AFTER, OVERLOAD}
-
-    VALID_DATA = {CAT: CATS_FOR_DERIVED | set(SIDE_TO_ANGLE.keys()),
-                  GR_TYPE: {'line',            # ----
-                            'inverted',        # ----o
-                            'clock',           # ----|>
-                            'inverted_clock',  # ----o>
-                            'input_low',       # ----|\
-                            'clock_low',       # --|\|>
-                            'output_low',      # ---/|
-                            'edge_clock_high', # --|\|>
-                            'non_logic'},      # ----x
-                  EL_TYPE: {'input',
-                            'output',
-                            'bidirectional',
-                            'tri_state',
-                            'open_collector',
-                            'open_emitter',
-                            'passive',
-                            'free',
-                            'unspecified',
-                            'no_connect',
-                            'power_in',
-                            'power_out'} }
+    CATS_FOR_DERIVED = frozenset({DELETE, BEFORE, AFTER, OVERLOAD})
+
+    VALID_DATA = {CAT: CATS_FOR_DERIVED | frozenset(SIDE_TO_ANGLE),
+                  GR_TYPE: frozenset({'line',             # ----
+                                      'inverted',         # ----o
+                                      'clock',            # ----|>
+                                      'inverted_clock',   # ----o>
+                                      'input_low',        # ----|\
+                                      'clock_low',        # --|\|>
+                                      'output_low',       # ---/|
+                                      'edge_clock_high',  # --|\|>
+                                      'non_logic'}),      # ----x
+                  EL_TYPE: frozenset({'input',
+                                      'output',
+                                      'bidirectional',
+                                      'tri_state',
+                                      'open_collector',
+                                      'open_emitter',
+                                      'passive',
+                                      'free',
+                                      'unspecified',
+                                      'no_connect',
+                                      'power_in',
+                                      'power_out'}) }
     INFO = {
         CAT: 'The category of a pin. For base symbols, the "Category" refers to the side \n'
         'on which the pin is located: "left", "right", "top" and "bottom"\n'
@@ -315,39 +351,12 @@ class PinHead:
         NUMBER_FONT_SIZE: 'Pin number font size in mills.'
     }
 
-    @classmethod
-    def more_doc(cls) -> str:
-        res = \
+    DOC_HEAD = \
 '''\nThe second line in the symbol csv file is the headline for the pin description.
 The first column of this line must be empty.\n\n'''
-        for item in cls.COLUMNS_NEED:
-            if item.name in cls.BOOL_FIELDS:
-                the_type = 'boolean'
-            elif item.name in cls.FLOAT_FIELDS:
-                the_type = 'float'
-            elif item.name in cls.INT_FIELDS:
-                the_type = 'integer'
-            else:
-                the_type = 'string'
-            if item.name in cls.DEFAULTS:
-                default = cls.DEFAULTS[item.name]
-            else:
-                default = 'no default'
-            is_sticky = item.name in cls.STICKY_FIELDS
-            res += f'{item.name.title()} --\t{NEED_DESCR[item.need.value]}  '\
-                f'Type: {the_type}  Is sticky: {is_sticky}  Default: {default}\n'
-            if item.name in cls.VALID_DATA:
-                vd = ''
-                for val in cls.VALID_DATA[item.name]:
-                    vd += val + ', '
-                res += f'    Valid values: {vd}\n'
-            if item.name in cls.INFO:
-                res += cls.INFO[item.name]
-                res += '\n'
-            res += "\n"
-        res += \
-f"""Pin numbers must be unique in one symbol. If the pin number has a value {cls.GAP!r}
-or '{cls.GAP} n' no pin is generated at n positions. You can use gaps to group pins
+    DOC_TAIL = \
+f"""Pin numbers must be unique in one symbol. If the pin number has a value {GAP!r}
+or '{GAP} n' no pin is generated at n positions. You can use gaps to group pins
 into sections.
 Sticky fields are copied from the previous line within a symbol.
 
@@ -365,10 +374,30 @@ alternative function must follow immediately and the 'pin number' list must be a
 subset of the main 'pin number' list. The generation of the serial number works
 independently for each alternative function.
 """
-        return res
 
+    @classmethod
+    def column_doc(cls, item:ColumnProp) -> str:
+        """Return the documentation of one pin column."""
+        the_type = column_type_descr(item.name, cls.BOOL_FIELDS, cls.INT_FIELDS,
+                                     cls.FLOAT_FIELDS)
+        default = cls.DEFAULTS.get(item.name, 'no default')
+        is_sticky = item.name in cls.STICKY_FIELDS
+        res = f'{item.name.title()} --\t{NEED_DESCR[item.need.value]}  '\
+            f'Type: {the_type}  Is sticky: {is_sticky}  Default: {default}\n'
+        if item.name in cls.VALID_DATA:
+            vd = ''.join(val + ', ' for val in cls.VALID_DATA[item.name])
+            res += f'    Valid values: {vd}\n'
+        if item.name in cls.INFO:
+            res += cls.INFO[item.name] + '\n'
+        return res + '\n'
 
-@dataclass
+    @classmethod
+    @cache
+    def more_doc(cls) -> str:
+        return cls.DOC_HEAD + ''.join(map(cls.column_doc, cls.COLUMNS_NEED)) + cls.DOC_TAIL
+
+
+@dataclass(slots=True)
 class Location:
     """Instances store the location of an csv record."""
     file: str
@@ -405,7 +434,23 @@ class LogicError(CsvToKicadError):
     pass
 
 
-CSVRecord = namedtuple('CSVRecord', 'columns location')
+@dataclass(slots=True, frozen=True)
+class CSVRecord:
+    """A stripped csv record and its position.
+
+    The Location object is only created on demand."""
+    columns: Union[list[str],str,None]
+    file: str
+    line: int
+    record: int
+
+    @property
+    def location(self) -> Location:
+        return Location(self.file, self.line, self.record)
+
+
+# Read buffer size for the csv input files
+CSV_READ_BUFFER = 1 << 20
 
 class MyCSVReader:
     """Special csv reader returns stripped line items, skips comment-lines and 
@@ -419,51 +464,96 @@ class MyCSVReader:
 
     def get_location(self) -> Location:
         return Location(self.file, self.csvreader.line_num, self.record)
+
+    def new_record(self, columns:Union[list[str],str,None]) -> CSVRecord:
+        """Return a csv record with columns at the current position."""
+        return CSVRecord(columns, self.file, self.csvreader.line_num, self.record)
     
     def get_record(self) -> CSVRecord:
         """Get the next csv record with stripped entries
         Throws: StopFileIteration
         """
-        res = [item.strip() for item in next(self.csvreader)]
+        res = list(map(str.strip, next(self.csvreader)))
         self.record += 1
-        loc = Location(self.file, self.csvreader.line_num, self.record)
-        return CSVRecord(res, loc)
+        return self.new_record(res)
     
-    def get_nonempty_line(self) -> CSVRecord:
-        """Get the next non empty and non comment csv record, strip values and return.
+    def _next_nonempty_columns(self) -> Union[list[str],str]:
+        """Return the stripped columns of the next non empty and non comment
+        csv record or EOT at the end of the file.
 
         Throws: csv.Error, LogicError
-        Returns the next csv record. Empty lines and comments are skipped.
-        EOT is returned at the end of the file.
         """
         while True:
             line = next(self.csvreader, Const.EOT)
-            if line != Const.EOT:
-                self.record += 1
-            loc = Location(self.file, self.csvreader.line_num, self.record)
             if line == Const.EOT:
-                return CSVRecord(line, loc)
-            elif isinstance(line, list):
-                res = [item.strip() for item in line]
-                for item in res:
-                    if item:
-                        if item.startswith('#'):
-                            break
-                        return CSVRecord(res, loc)
+                return line
+            self.record += 1
+            if isinstance(line, list):
+                res = list(map(str.strip, line))
+                # the first non empty item decides: comment or data
+                first = next(filter(None, res), '')
+                if first and not first.startswith('#'):
+                    return res
             else:
-                raise LogicError(f'Wrong type in get_nonempty_line(): {line!r}',loc)
+                raise LogicError(f'Wrong type in get_nonempty_line(): {line!r}',
+                                 self.get_location())
             self.skipped_empty += 1
 
+    def get_nonempty_line(self) -> CSVRecord:
+        """Get the next non empty and non comment csv record, strip values and return.
+
+        Throws: csv.Error, LogicError
+        Returns the next csv record. Empty lines and comments are skipped.
+        EOT is returned at the end of the file.
+        """
+        return self.new_record(self._next_nonempty_columns())
+
+    def get_nonpin_line(self) -> Tuple[CSVRecord,int]:
+        """Get the next csv record with a non empty first column.
+
+        Throws: csv.Error, LogicError
+        Returns the next csv record and the number of skipped pin records.
+        Empty lines and comments are skipped. EOT is returned at the end of
+        the file. Only the returned record is wrapped in a CSVRecord.
+        """
+        skipped_pins = 0
+        while True:
+            columns = self._next_nonempty_columns()
+            if (columns == Const.EOT) or columns[0]:
+                return self.new_record(columns), skipped_pins
+            skipped_pins += 1
+
 Attrib : TypeAlias = Union[str,int,float,bool]
-@dataclass
+@dataclass(slots=True, eq=False)
 class Pin:
-    """Internal representation of a pin."""
+    """Internal representation of a pin.
+
+    Each pin column is stored in its own attribute (see PinHead.ATTRIBUTES).
+    None denotes a missing column value.
+    """
     loc: Location
     protected: bool = field(default=False, init=False)
-    attribs: dict[str,Attrib] = field(default_factory=dict)
+    cat: Optional[str] = None
+    number: Optional[str] = None
+    name: Optional[str] = None
+    gr_type: Optional[str] = None
+    el_type: Optional[str] = None
+    stacked: Optional[bool] = None
+    hidden: Optional[bool] = None
+    length: Optional[float] = None
+    name_font_size: Optional[float] = None
+    number_font_size: Optional[float] = None
+    # the checked bus pin numbers, cached for the pin number in bus_number
+    bus_number: Optional[str] = field(default=None, init=False, repr=False,
+                                      compare=False)
+    bus_list: Tuple[str,...] = field(default=(), init=False, repr=False,
+                                     compare=False)
+    bus_set: frozenset[str] = field(default=frozenset(), init=False, repr=False,
+                                    compare=False)
 
     def __post_init__(self):
-        vpr("Pin created:", self.__dict__, level=Verbosity.VERY_VERB)
+        if very_verbose:
+            vpr("Pin created:", self, level=Verbosity.VERY_VERB)
 
     def is_protected(self) -> bool:
         return self.protected
@@ -472,119 +562,145 @@ class Pin:
         self.protected = val
 
     def add_attr(self, name:str, value:Attrib) -> None:
-        self.attribs[name] = value
+        setattr(self, PinHead.ATTRIBUTES[name], value)
     
     def get_attr(self, name: str) -> Attrib:
-        if not name in self.attribs:
+        value = getattr(self, PinHead.ATTRIBUTES[name])
+        if value is None:
             raise LogicError(f'No attribute {name!r}', self.loc)
-        return self.attribs[name]
+        return value
 
     def has_attr(self, name: str) -> bool:
-        return name in self.attribs
+        return getattr(self, PinHead.ATTRIBUTES[name]) is not None
 
     def set_gap(self, value:str) -> None:
-        self.attribs[PinHead.NUMBER] = value
+        self.number = value
 
     def is_gap(self) -> bool:
-        if not PinHead.NUMBER in self.attribs:
+        if self.number is None:
             raise LogicError('in is_separator_or_gap()', self.loc)
-        return PinHead.is_gap(self.attribs[PinHead.NUMBER])
+        return PinHead.is_gap(self.number)
 
     def get_gap_count(self) -> int:
-        if not PinHead.NUMBER in self.attribs:
+        if self.number is None:
             raise LogicError('in is_separator_or_gap()', self.loc)
-        value = self.attribs[PinHead.NUMBER]
+        value = self.number
         res = PinHead.get_gap_count(value)
         if res is None:
             raise PinError(f'No valid get_gap_count: value: {value!r}', self.loc)
         return res
 
     def is_hidden(self) -> bool:
-        return PinHead.HIDDEN in self.attribs and self.attribs[PinHead.HIDDEN]
+        return bool(self.hidden)
 
     def is_stacked(self) -> bool:
-        return PinHead.STACKED in self.attribs and self.attribs[PinHead.STACKED]
+        return bool(self.stacked)
     
     def is_pseudo_pin(self) -> bool:
-        if PinHead.CAT in self.attribs:
-            return self.attribs[PinHead.CAT] in PinHead.CATS_FOR_DERIVED
-        else:
-            return False
-
-    def get_cat(self) -> str:
-        if not PinHead.CAT in self.attribs:
-            raise LogicError(f'No attribute {PinHead.CAT!r}', self.loc)
-        return self.attribs[PinHead.CAT]
+        return self.cat in PinHead.CATS_FOR_DERIVED
 
-    def get_number(self) -> str:
-        if not PinHead.NUMBER in self.attribs:
-            raise LogicError(f'No attribute {PinHead.NUMBER!r}', self.loc)
-        return self.attribs[PinHead.NUMBER]
-    
     def get_name(self) -> str:
-        if not PinHead.NAME in self.attribs:
+        if self.name is None:
             raise LogicError(f'No attribute {PinHead.NAME!r}', self.loc)
-        return self.attribs[PinHead.NAME]
+        return self.name
 
     def is_bus(self) -> bool:
-        return ',' in self.get_number()
+        return ',' in self.number
     
-    def get_checked_bus_pin_list(self) -> list[str]:
-        """Get the bus pin list and check against duplicate elements"""
-        elems = [item.strip() for item in self.get_number().split(',')]
-        check = set()
-        for item in elems:
-            if item in check:
-                raise PinError(f'Duplicate pin: {item!r} in bus: {elems}', self.loc)
-            check.add(item)
-        return elems
+    def get_checked_bus_pin_list(self) -> Tuple[str,...]:
+        """Get the bus pin numbers as hashable tuple and check against duplicate elements"""
+        number = self.number
+        if number != self.bus_number:
+            elems = [item.strip() for item in number.split(',')]
+            check = set()
+            for item in elems:
+                if item in check:
+                    raise PinError(f'Duplicate pin: {item!r} in bus: {elems}', self.loc)
+                check.add(item)
+            self.bus_list = tuple(elems)
+            self.bus_set = frozenset(elems)
+            self.bus_number = number
+        return self.bus_list
+
+    def get_bus_pin_set(self) -> frozenset[str]:
+        """Get the checked bus pin numbers as set"""
+        self.get_checked_bus_pin_list()
+        return self.bus_set
 
     def is_alt_func_pin(self, next_pin) -> bool:
         if self.is_gap() or next_pin.is_gap():
             return False
         if self.is_bus():
-            my_pin_numbers = set(self.get_checked_bus_pin_list())
-            new_pin_list = set(next_pin.get_checked_bus_pin_list())
-            return new_pin_list <= my_pin_numbers
+            my_pin_numbers = self.get_bus_pin_set()
+            return next_pin.get_bus_pin_set() <= my_pin_numbers
         else:
-            return self.get_number() == next_pin.get_number()
+            return self.number == next_pin.number
 
 
+BOOL_VALUES = {'': False,
+               'y': True, 'yes': True, 'true': True,
+               'n': False, 'no': False, 'false': False}
+
 def convert_to_bool(val:str, column_name:str, loc:Location) -> bool:
     """Get the boolean value from a yes/no field entry and return"""
-    if val:
-        temp = val
-        val = temp.lower()
-        if val in {'y', 'yes', 'true'}:
-            return True
-        elif val in {'n', 'no', 'false'}:
-            return False
-        else:
-            raise ValidationError(f'Wrong value {val!r} in {column_name} '
-                  f' Valid values: "yes" or "no".', loc)
-    else:
-        return False
+    val = val.lower()
+    res = BOOL_VALUES.get(val)
+    if res is None:
+        raise ValidationError(f'Wrong value {val!r} in {column_name} '
+              f' Valid values: "yes" or "no".', loc)
+    return res
     
 
-def convert_inp(value:str, name:str, bool_fields:set[str], int_fields:set[str],
-                float_fields:set[str], loc:Location) -> Attrib:
-    res = None
-    try:
-        if name in bool_fields:
-            res = convert_to_bool(value, name, loc)
-        elif name in int_fields:
-            res = int(value)
-        elif name in float_fields:
-            res = float(value)
-        else:
-            res = value
-    except ValueError as error:
-        raise ValidationError(f'Error during conversation of column: {name} '
-                              f'value: {value!r}! Message {error}', loc)
-    return res
+Converter : TypeAlias = Callable[[str,Location],Attrib]
+
+def get_converter(name:str, bool_fields:frozenset[str],
+                  int_fields:frozenset[str],
+                  float_fields:frozenset[str]) -> Converter:
+    """Return the function which converts the values of column 'name'.
+
+    The returned function takes the value and the location and throws
+    ValidationError if the value can not be converted.
+    """
+    if name in bool_fields:
+        def convert_bool(value:str, loc:Location) -> bool:
+            return convert_to_bool(value, name, loc)
+        return convert_bool
+    elif name in int_fields:
+        to_type = int
+    elif name in float_fields:
+        to_type = float
+    else:
+        return lambda value, loc: value
+
+    def convert(value:str, loc:Location) -> Attrib:
+        try:
+            return to_type(value)
+        except ValueError as error:
+            raise ValidationError(f'Error during conversation of column: {name} '
+                                  f'value: {value!r}! Message {error}', loc)
+    return convert
+
+@cache
+def column_converters(head:type) -> MappingProxyType[str,Converter]:
+    """Return the converters of all columns of the head class SymHead or PinHead.
+
+    The converters do not depend on the csv file, hence they are built once
+    and shared by all processors as read-only mapping.
+    """
+    return MappingProxyType({item.name: get_converter(item.name, head.BOOL_FIELDS,
+                                                      head.INT_FIELDS, head.FLOAT_FIELDS)
+                             for item in head.COLUMNS_NEED})
 
 
-def validate_value(value:str, valid_values:set[str], column_name:str,
+@cache
+def header_field_sets(head:type) -> Tuple[frozenset[str],frozenset[str]]:
+    """Return the required and all header fields of the head class SymHead or PinHead."""
+    required = frozenset(item.name for item in head.COLUMNS_NEED
+                         if (item.need == Need.VAL) or (item.need == Need.MAN))
+    return required, frozenset(item.name for item in head.COLUMNS_NEED)
+
+
+def validate_value(value:str, valid_values:frozenset[str], column_name:str,
                    loc:Location) -> None:
     """Validate symbol/pin value and throw ValidationError if invalid.
 
@@ -594,33 +710,26 @@ def validate_value(value:str, valid_values:set[str], column_name:str,
       column_name  -- column name
       loc          -- the current location info
     Globals:
-      vpr       -- the log printer 
+      vpr          -- the log printer 
+      very_verbose -- True if the very verbose messages are printed
     Throws: ValidationError
     """
     if value in valid_values:
-        vpr(f'validate_value: Column {column_name} value {value!r} validated.',
-            level=Verbosity.VERY_VERB)
+        if very_verbose:
+            vpr(f'validate_value: Column {column_name} value {value!r} validated.',
+                level=Verbosity.VERY_VERB)
         return
     else:
         raise ValidationError(f'Column {column_name} value {value!r} is invalid!\n'
-                              f'Valid values: {valid_values}', loc)
+                              f'Valid values: {set(valid_values)}', loc)
 
 
-def clone_bus_pin(pin:Pin, number:str, rex:str, serial:int) -> Pin:
+def clone_bus_pin(pin:Pin, number:str, pattern:Optional[re.Pattern],
+                  serial:int) -> Pin:
     """Clone bus pin to a physical pin number and convert bus pin name"""
-    bus_pin = Pin(pin.loc)
-    for pin_attr_name in pin.attribs.keys():
-        if pin_attr_name == PinHead.NUMBER:
-            bus_pin.attribs[pin_attr_name] = number
-        elif pin_attr_name == PinHead.NAME:
-            if rex:
-                bus_pin.attribs[pin_attr_name] = \
-                    re.sub(rex, str(serial), pin.get_name())
-            else:
-                bus_pin.attribs[pin_attr_name] = pin.get_name()
-        else:
-            bus_pin.attribs[pin_attr_name] = pin.attribs[pin_attr_name]
-    return bus_pin
+    if pattern:
+        return replace(pin, number=number, name=pattern.sub(str(serial), pin.get_name()))
+    return replace(pin, number=number)
 
 
 @dataclass
@@ -631,14 +740,28 @@ class PinProcessor:
     line header analysis of the current csv-file:
         head_list -- a copy of the head line as list[str]
         head_cols -- the assignement title -> column number as dict[int]
+        converters -- the assignement title -> value converter
+        pin_steps -- the pin columns in parse order with column number (or None),
+                     converter, valid values (or None), sticky flag and
+                     default value (or None)
     """
     reader: MyCSVReader
     head_list: list = field(init=False)
-    head_cols: dict[str:int] = field(init=False)
+    head_cols: dict[str,int] = field(init=False)
+    converters: MappingProxyType[str,Converter] = field(init=False)
+    pin_steps: list[Tuple[ColumnProp,Optional[int],Converter,
+                          Optional[frozenset[str]],bool,Optional[str]]] = field(init=False)
 
     def __post_init__(self):
         self.head_list, self.head_cols = parse_header(
-            PinHead.COLUMNS_NEED, self.reader, False)
+            PinHead, self.reader, False)
+        self.converters = column_converters(PinHead)
+        self.pin_steps = [(item, self.head_cols.get(item.name),
+                           self.converters[item.name],
+                           PinHead.VALID_DATA.get(item.name),
+                           item.name in PinHead.STICKY_FIELDS,
+                           PinHead.DEFAULTS.get(item.name))
+                          for item in PinHead.COLUMNS_NEED]
 
     def parse_pin(self, inp:CSVRecord, previous_pin:Pin, previous_cat:str) -> Pin: 
         """Process one pin record and return a validated pin-dict.
@@ -650,44 +773,40 @@ class PinProcessor:
         Globals:
         PinHead      -- class attributes
         vpr          -- the log printer 
-        Returns: validated pin as as dictionary.
+        Returns: validated pin.
         Throws: LogicError, PinError
 
-        Pin is a dictionary like:
-        {'pin category':'aSide', 'pin number':'aNumber', 'pin name', 'aName', 'stacked':True}
+        The column values are stored in the pin attributes, e.g.:
+        Pin(cat='aSide', number='aNumber', name='aName', stacked=True, ...)
         Alternative pin functions follow as entry in pin list with same 'number'
         If name or number is '---' or '--- n', it is or a gap or n gaps.
         A separator/gap takes the space of one pin but does not generate a pin-symbol
         """
         vpr(f'parse_pin inp: {inp.columns}', level=Verbosity.VERBOSE)
+        loc = inp.location
 
         if not isinstance(inp.columns, list):
-            raise LogicError(f'Wrong type in parse_pin()!', inp.location)
+            raise LogicError(f'Wrong type in parse_pin()!', loc)
         # In pin records the first column must be empty
         if inp.columns[0]:
-            raise LogicError(f'Wrong record {inp.columns} in parse_pin!', inp.location)
+            raise LogicError(f'Wrong record {inp.columns} in parse_pin!', loc)
         # check surplus data fields and data values with no header entry
-        i = 0
-        while(i < len(inp.columns)):
-            if i >= len(self.head_list):
-                raise PinError(f'Surplus pin data fields: {inp.columns}', inp.location)
-            if not self.head_list[i] and inp.columns[i]:
-                raise PinError(f'Surplus pin data field {inp.columns[i]!r}', inp.location)
-            i += 1
+        for head, value in zip(self.head_list, inp.columns):
+            if not head and value:
+                raise PinError(f'Surplus pin data field {value!r}', loc)
+        if len(inp.columns) > len(self.head_list):
+            raise PinError(f'Surplus pin data fields: {inp.columns}', loc)
         # build pin object and check values
-        pin = Pin(inp.location)
+        pin = Pin(loc)
         # expected order: category, number, name, ...
         break_condition = ''
-        for item in PinHead.COLUMNS_NEED:
+        for item, column, convert, valid_values, sticky, default in self.pin_steps:
             check_fields = break_condition == ''
             # get column and value
-            column = None
-            value = ''
-            if item.name in self.head_cols:
-                column = self.head_cols[item.name]
-                value = inp.columns[column]
-            vpr(f'parse_pin: item: {item!r} column: {column} value: {value!r}',
-                level=Verbosity.VERY_VERB)
+            value = inp.columns[column] if column is not None else ''
+            if very_verbose:
+                vpr(f'parse_pin: item: {item!r} column: {column} value: {value!r}',
+                    level=Verbosity.VERY_VERB)
             # check separator or gap
             if (item.name == PinHead.NUMBER) and PinHead.is_gap(value):
                     pin.set_gap(value)
@@ -696,81 +815,101 @@ class PinProcessor:
             if (item.name == PinHead.NAME):
                 if pin.is_pseudo_pin():
                     break_condition = 'pseudo pin'
-                    if (pin.get_cat() == PinHead.OVERLOAD) and pin.get_number():
-                        raise PinError(f'Pin number is not allowed for overload!', inp.location)
+                    if (pin.cat == PinHead.OVERLOAD) and pin.number:
+                        raise PinError(f'Pin number is not allowed for overload!', loc)
             if check_fields:
                 # propagate sticky fields if necessary and possible
-                if (not value) and (item.name in PinHead.STICKY_FIELDS):
+                # a propagated value is already converted
+                sticky_value = None
+                if (not value) and sticky:
                     if item.name == PinHead.CAT:
                         if previous_cat:
                             value = previous_cat
                     else:
                         if previous_pin and previous_pin.has_attr(item.name):
-                            v_str = str(previous_pin.get_attr(item.name))
+                            previous_value = previous_pin.get_attr(item.name)
+                            v_str = str(previous_value)
                             if v_str:
                                 value = v_str
+                                sticky_value = previous_value
                 # check need
                 if not value:
                     if item.need == Need.VAL:
-                        if not pin.get_cat() == PinHead.OVERLOAD:
-                            raise PinError(f'Value is required for {item.name!r}', inp.location)
+                        if not pin.cat == PinHead.OVERLOAD:
+                            raise PinError(f'Value is required for {item.name!r}', loc)
                 # add defaults
-                if not value and (item.name in PinHead.DEFAULTS):
-                    value = PinHead.DEFAULTS[item.name]
+                if not value and (default is not None):
+                    value = default
                 # check valid entries
-                if item.name in PinHead.VALID_DATA:
-                    validate_value(value, PinHead.VALID_DATA[item.name], item.name,
-                                inp.location)
+                if valid_values is not None:
+                    validate_value(value, valid_values, item.name, loc)
                 # add name:value to pin
                 if value or (item.need != Need.OPT):
                     # Need.MAN and Need.VAL are always put
-                    va = convert_inp(value, item.name, PinHead.BOOL_FIELDS,
-                                        PinHead.INT_FIELDS, PinHead.FLOAT_FIELDS,
-                                        inp.location)
+                    if sticky_value is None:
+                        va = convert(value, loc)
+                    else:
+                        va = sticky_value
                     pin.add_attr(item.name, va)
             else:
                 if value:
                     print(f'WARNING: Ignored value: {value!r} in {break_condition} column: {item.name!r}',
-                          inp.location, file=sys.stderr)
+                          loc, file=sys.stderr)
         vpr(f'parse_pin returns: {pin}', level=Verbosity.VERBOSE)
         return pin
 
 
 BusBuildSchema = namedtuple('BusBuildSchema', 'rex start increment')
 
-BUS_BUILD_REX = [r'\$\((\d+)([+-])?(\d+)?\)',
-                r'\$']
+BUS_BUILD_REX = [re.compile(r'\$\((\d+)([+-])?(\d+)?\)'),
+                 re.compile(r'\$')]
 
-def get_bus_build_schema(name:str, loc:Location) -> BusBuildSchema:
-    vpr(f'get_bus_build_schema() : name: {name}', level=Verbosity.VERY_VERB)
+@cache
+def make_bus_build_schema(name:str) -> BusBuildSchema:
+    """Evaluate the bus build schema of a pin name and return it.
+
+    The results are cached per name. Throws ValueError if the name has an
+    invalid operation.
+    """
     operation = '+'
     inc = 1
     start = 0
-    rex = BUS_BUILD_REX[0]
-    the_match = re.search(rex, name)
+    rex = BUS_BUILD_REX[0].pattern
+    the_match = BUS_BUILD_REX[0].search(name)
     if the_match:
-        if not the_match.group(3) is None:
-            inc = int(the_match.group(3))
-        if not the_match.group(2) is None:
-            operation = the_match.group(2)
-        start = int(the_match.group(1))
+        start_str, op_str, inc_str = the_match.groups()
+        if inc_str is not None:
+            inc = int(inc_str)
+        if op_str is not None:
+            operation = op_str
+        start = int(start_str)
     else:
-        rex = BUS_BUILD_REX[1]
-        the_match = re.search(rex, name)
+        rex = BUS_BUILD_REX[1].pattern
+        the_match = BUS_BUILD_REX[1].search(name)
     if the_match:
-        vpr(f'get_bus_build_schema() : rex: {rex} group(): {the_match.group()} groups: '
-            f'{the_match.groups()}', level=Verbosity.VERY_VERB)
+        if very_verbose:
+            vpr(f'get_bus_build_schema() : rex: {rex} group(): {the_match.group()} '
+                f'groups: {the_match.groups()}', level=Verbosity.VERY_VERB)
         if operation == '+':
             pass
         elif operation == '-':
             inc = inc * -1
         else:
-            raise LogicError(f'Error in get_bus_build_schema name:{name!r} '
-                             f'rex: {rex!r} operation: {operation!r}', loc)
+            raise ValueError(f'Error in get_bus_build_schema name:{name!r} '
+                             f'rex: {rex!r} operation: {operation!r}')
     else:
-        vpr(f'get_bus_build_schema() : no match!', level=Verbosity.VERY_VERB)
+        if very_verbose:
+            vpr(f'get_bus_build_schema() : no match!', level=Verbosity.VERY_VERB)
         rex = ''
-    res = BusBuildSchema(rex, start, inc)
+    return BusBuildSchema(rex, start, inc)
+
+def get_bus_build_schema(name:str, loc:Location) -> BusBuildSchema:
+    if very_verbose:
+        vpr(f'get_bus_build_schema() : name: {name}', level=Verbosity.VERY_VERB)
+    try:
+        res = make_bus_build_schema(name)
+    except ValueError as err:
+        raise LogicError(str(err), loc)
     vpr(f'get_bus_build_schema returns: {res}', level=Verbosity.VERBOSE)                
     return res
 
@@ -779,7 +918,7 @@ PinShapeProps = namedtuple('PinShapeProps',
 'width_h height_h pin_count_l pin_count_r pin_count_t pin_count_b '
 'len_l, len_r, len_t, len_b')
 
-@dataclass
+@dataclass(slots=True)
 class Symbol:
     """Internal representation of a symbol.
     
@@ -792,7 +931,8 @@ class Symbol:
     pins: list[Pin] = field(default_factory=list)
 
     def __post_init__(self):
-        vpr("Symbol created:", self.__dict__, level=Verbosity.VERY_VERB)
+        if very_verbose:
+            vpr("Symbol created:", self, level=Verbosity.VERY_VERB)
 
     def add_attr(self, name:str, value:Attrib) -> None:
         if name == SymHead.NAME:
@@ -827,15 +967,22 @@ class Symbol:
     def get_derived(self) -> str:
         return self.attribs[SymHead.DERIVE_FROM]
 
-    def get_max_pin_len(self, side:str) -> float:
-        res = 0.0
+    def get_side_pins(self) -> dict[str,list[Pin]]:
+        """Get the pins sorted into one list per side. The pin order is kept."""
+        res = {side: [] for side in PinHead.SIDE_TO_ANGLE}
         for pin in self.pins:
-            if pin.get_cat() == side and not pin.is_gap() and not pin.is_pseudo_pin():
+            res.setdefault(pin.cat, []).append(pin)
+        return res
+
+    def get_max_pin_len(self, side:str, side_pin_list:list[Pin]) -> float:
+        res = 0.0
+        for pin in side_pin_list:
+            if not pin.is_gap() and not pin.is_pseudo_pin():
                 res = max(res, pin.get_attr(PinHead.LEN))
         vpr(side, 'get_max_pin_len returns:', res, level=Verbosity.VERY_VERB)
         return res
 
-    def get_effective_pin_count(self, side:str) -> int:
+    def get_effective_pin_count(self, side:str, side_pin_list:list[Pin]) -> int:
         """Get the count of the effective pin count of one side and check conditions
 
         The effective pin count is the count of the pins in list pins minus number
@@ -843,45 +990,45 @@ class Symbol:
         Separators and gaps are counted."""
         count = 0
         main_pin:Pin = None
-        for pin in self.pins:
-            if pin.get_cat() == side:
-                if pin.is_pseudo_pin():
-                    raise LogicError(f'get_effective_pin_count(): No pseudo pins '
-                                     f'allowed here!', pin.loc)
-                if pin.is_stacked():
-                    if main_pin and main_pin.is_alt_func_pin(pin):
+        for pin in side_pin_list:
+            if pin.is_pseudo_pin():
+                raise LogicError(f'get_effective_pin_count(): No pseudo pins '
+                                 f'allowed here!', pin.loc)
+            if pin.is_stacked():
+                if main_pin and main_pin.is_alt_func_pin(pin):
+                    raise PinError(f'get_effective_pin_count(): alternative '
+                        f'function must not be stacked: {pin}', pin.loc)
+                main_pin = None
+            elif pin.is_gap():
+                count += pin.get_gap_count()
+                main_pin = None
+            elif main_pin is None:
+                count += len(pin.get_checked_bus_pin_list())
+                main_pin = pin
+            else:
+                if main_pin.is_alt_func_pin(pin):
+                    if pin.is_hidden() != main_pin.is_hidden():
                         raise PinError(f'get_effective_pin_count(): alternative '
-                            f'function must not be stacked: {pin}', pin.loc)
-                    main_pin = None
-                elif pin.is_gap():
-                    count += pin.get_gap_count()
-                    main_pin = None
-                elif main_pin is None:
+                        f'function hidden: {pin.is_hidden()} Main pin hidden: '
+                        f'{main_pin.is_hidden()} combination not allowed!', pin.loc)
+                else:
                     count += len(pin.get_checked_bus_pin_list())
                     main_pin = pin
-                else:
-                    if main_pin.is_alt_func_pin(pin):
-                        if pin.is_hidden() != main_pin.is_hidden():
-                            raise PinError(f'get_effective_pin_count(): alternative '
-                            f'function hidden: {pin.is_hidden()} Main pin hidden: '
-                            f'{main_pin.is_hidden()} combination not allowed!', pin.loc)
-                    else:
-                        count += len(pin.get_checked_bus_pin_list())
-                        main_pin = pin
         vpr(side, 'get_effective_pin_count returns:', count, level=Verbosity.VERBOSE)
         return count
 
-    def get_pin_shape(self) -> PinShapeProps:
+    def get_pin_shape(self, side_pins:dict[str,list[Pin]]) -> PinShapeProps:
         """Get the minimal rectangle depending on the pin count. Return 1/2 height 
         and 1/2 width in multiples of the pin grid len. 
+        side_pins are the pins sorted by side (see get_side_pins)
     
         l - edge length; p - pin count; g - pin grid
         l >= (p - 1) * g
         """
-        pin_count_l = self.get_effective_pin_count('left')
-        pin_count_r = self.get_effective_pin_count('right')
-        pin_count_t = self.get_effective_pin_count('top')
-        pin_count_b = self.get_effective_pin_count('bottom')
+        pin_count_l = self.get_effective_pin_count('left', side_pins['left'])
+        pin_count_r = self.get_effective_pin_count('right', side_pins['right'])
+        pin_count_t = self.get_effective_pin_count('top', side_pins['top'])
+        pin_count_b = self.get_effective_pin_count('bottom', side_pins['bottom'])
         width_half = get_half_len(max(pin_count_t, pin_count_b))
         height_half = get_half_len(max(pin_count_l, pin_count_r))
         m_w_h = self.attribs[SymHead.MIN_W] // 2
@@ -896,8 +1043,10 @@ class Symbol:
             height_half = m_h_h
         psp = PinShapeProps(width_half, height_half, pin_count_l, pin_count_r,
                         pin_count_t, pin_count_b,
-                        self.get_max_pin_len('left'), self.get_max_pin_len('right'),
-                        self.get_max_pin_len('top'), self.get_max_pin_len('bottom'))
+                        self.get_max_pin_len('left', side_pins['left']),
+                        self.get_max_pin_len('right', side_pins['right']),
+                        self.get_max_pin_len('top', side_pins['top']),
+                        self.get_max_pin_len('bottom', side_pins['bottom']))
 
         vpr(f'get_pin_shape: psp.width_h={psp.width_h} psp.height_h={psp.height_h} '
             f'count_l={pin_count_l} count_r={pin_count_r} count_t={pin_count_t} '
@@ -907,27 +1056,36 @@ class Symbol:
     def build_symbol(self, filename:str, libname:str) -> kicad.KicadSymbol:
         """Build and return the Kicad new_symbol"""
         # real width is 2 * w, real heigth is 2 * h
-        psp = self.get_pin_shape()
+        side_pins = self.get_side_pins()
+        psp = self.get_pin_shape(side_pins)
+        attribs = self.attribs
+        h_padding = attribs[SymHead.H_PADDING]
+        w_padding = attribs[SymHead.W_PADDING]
+        grid = Const.GRID
         new_symbol = kicad.KicadSymbol(self.get_name(), libname, filename)
         # add text properties
-        py = psp.height_h + psp.len_b + self.get_attr(SymHead.H_PADDING) + \
+        py = psp.height_h + psp.len_b + h_padding + \
             Const.HIDDEN_TEXT_GAP
         py = py * -1
-        for p in SymHead.MAN_PROPS:
-            prop = kicad.Property(SymHead.KICAD_PROPERTY_NAMES[p], self.attribs[p])
+        for kicad_name, p, shift in SymHead.man_props_meta():
+            prop = kicad.Property(kicad_name, attribs[p])
             prop.effects.is_hidden = True
-            if p in SymHead.HIDDEN_PROPS_TO_SHIFT:
-                prop.posy = py * Const.GRID
+            if shift:
+                prop.posy = py * grid
                 py -= Const.HIDDEN_TEXT_GAP
             new_symbol.properties.append(prop)
-        for p in SymHead.OPT_PROPS:
-            if p in self.attribs and self.attribs[p]:
-                prop = kicad.Property(SymHead.KICAD_PROPERTY_NAMES[p], self.attribs[p])
+            if p == SymHead.REFERENCE:
+                ref_prop = prop
+            elif p == SymHead.VALUE:
+                val_prop = prop
+        for kicad_name, p in SymHead.opt_props_meta():
+            if p in attribs and attribs[p]:
+                prop = kicad.Property(kicad_name, attribs[p])
                 prop.effects.is_hidden = True
                 new_symbol.properties.append(prop)
         # place reference and value on top and below bottom
-        pyref = (psp.height_h + self.attribs[SymHead.H_PADDING]
-                 + self.attribs[SymHead.H_REF_VALUE_GAP]) * Const.GRID
+        pyref = (psp.height_h + h_padding
+                 + attribs[SymHead.H_REF_VALUE_GAP]) * grid
         pyval = pyref * -1.0
         pxref = 0
         pxval = 0
@@ -943,38 +1101,35 @@ class Symbol:
             else:
                 px_first_top_pin = 0
                 px_last_top_pin = 0
-            pxref = (px_first_top_pin - self.attribs[SymHead.W_REF_VALUE_PIN_GAP]) \
-                * Const.GRID
-            pxval = (px_last_top_pin + self.attribs[SymHead.W_REF_VALUE_PIN_GAP]) \
-                * Const.GRID
+            w_ref_value_pin_gap = attribs[SymHead.W_REF_VALUE_PIN_GAP]
+            pxref = (px_first_top_pin - w_ref_value_pin_gap) * grid
+            pxval = (px_last_top_pin + w_ref_value_pin_gap) * grid
             justifyref = 'right'
             justifyval = 'left'
-        prop = new_symbol.get_property(SymHead.KICAD_PROPERTY_NAMES[SymHead.REFERENCE])
-        prop.effects.is_hidden = False
-        prop.effects.h_justify = justifyref
-        prop.posx = pxref
-        prop.posy = pyref
-        prop.rotation = 0.0
-        prop = new_symbol.get_property(SymHead.KICAD_PROPERTY_NAMES[SymHead.VALUE])
-        prop.effects.is_hidden = False
-        prop.effects.h_justify = justifyval
-        prop.posx = pxval
-        prop.posy = pyval
-        prop.rotation = 0.0
+        ref_prop.effects.is_hidden = False
+        ref_prop.effects.h_justify = justifyref
+        ref_prop.posx = pxref
+        ref_prop.posy = pyref
+        ref_prop.rotation = 0.0
+        val_prop.effects.is_hidden = False
+        val_prop.effects.h_justify = justifyval
+        val_prop.posx = pxval
+        val_prop.posy = pyval
+        val_prop.rotation = 0.0
 
         if self.is_extension():
-            new_symbol.extends = self.attribs[SymHead.EXTENDS]
+            new_symbol.extends = attribs[SymHead.EXTENDS]
             return new_symbol
         # place the body rectangle
-        body_w = (psp.width_h + self.attribs[SymHead.W_PADDING]) * Const.GRID
-        body_h = (psp.height_h + self.attribs[SymHead.H_PADDING]) * Const.GRID
+        body_w = (psp.width_h + w_padding) * grid
+        body_h = (psp.height_h + h_padding) * grid
         body = kicad.Rectangle(body_w * -1, body_h * -1, body_w, body_h)
         body.stroke_width = kicad.mil_to_mm(Const.BODY_LINE_WIDTH)
         new_symbol.rectangles.append(body)
         # place symbol text
-        if (SymHead.TEXT in self.attribs) and self.attribs[SymHead.TEXT]:
-            title = self.attribs[SymHead.TEXT]
-            my_text_gap = self.attribs[SymHead.TEXT_GAP]
+        if (SymHead.TEXT in attribs) and attribs[SymHead.TEXT]:
+            title = attribs[SymHead.TEXT]
+            my_text_gap = attribs[SymHead.TEXT_GAP]
             # if no special text gap is given, the value depends on symbol size
             if my_text_gap == float(SymHead.DEFAULTS[SymHead.TEXT_GAP]):
                 pin_max = max(psp.pin_count_l, psp.pin_count_r)
@@ -985,195 +1140,205 @@ class Symbol:
                 else:
                     my_text_gap = Const.TEXT_GAP
             vpr(f'build_symbol: text gap result: {my_text_gap}', level=Verbosity.VERBOSE)
-            posy = psp.height_h + self.attribs[SymHead.H_PADDING] - my_text_gap
+            posy = psp.height_h + h_padding - my_text_gap
             if posy < 0.0:
                 posy = 0.0
-            posy_mm = posy * Const.GRID
-            fs_mm = kicad.mil_to_mm(self.attribs[SymHead.TEXT_FONT_SIZE])
+            posy_mm = posy * grid
+            fs_mm = kicad.mil_to_mm(attribs[SymHead.TEXT_FONT_SIZE])
             text_eff = kicad.TextEffect(fs_mm, fs_mm)
             text = kicad.Text(title, 0.0, posy_mm, 0.0, text_eff)
             new_symbol.texts.append(text)
         # other optionale attributes
-        new_symbol.in_bom = self.attribs[SymHead.IN_BOM]
-        new_symbol.on_board = self.attribs[SymHead.ON_BOARD]
-        new_symbol.hide_pin_numbers = self.attribs[SymHead.PIN_NUMBERS_HIDE]
-        new_symbol.pin_names_offset = kicad.mil_to_mm(self.attribs[SymHead.PIN_NAME_OFFSET])
-        new_symbol.hide_pin_names = self.attribs[SymHead.PIN_NAMES_HIDE]
+        new_symbol.in_bom = attribs[SymHead.IN_BOM]
+        new_symbol.on_board = attribs[SymHead.ON_BOARD]
+        new_symbol.hide_pin_numbers = attribs[SymHead.PIN_NUMBERS_HIDE]
+        new_symbol.pin_names_offset = kicad.mil_to_mm(attribs[SymHead.PIN_NAME_OFFSET])
+        new_symbol.hide_pin_names = attribs[SymHead.PIN_NAMES_HIDE]
 
-        self.build_all_pins(new_symbol, psp)
+        self.build_all_pins(new_symbol, psp, side_pins)
         return new_symbol
 
-    def build_all_pins(self, kicad_sym:kicad.KicadSymbol, psp:PinShapeProps) -> None:
+    def build_all_pins(self, kicad_sym:kicad.KicadSymbol, psp:PinShapeProps,
+                       side_pins:dict[str,list[Pin]]) -> None:
         """Build all pins of an symbol from pins and append to symbol
         
-        Goes through all 4 sides left, right, top and bottom
+        Goes through all 4 sides left, right, top and bottom of side_pins
         """
-
         pin_number_set = set()
-
-        def collect_alt_functions(side_pin_list:list[Pin], shift_pos) -> None:
-            """Collect all associated alternative functions of one pin in alt_func_list
-            
-            Goes through side_pin_list, collects the alternative functions of a pin
-            in alt_func_list, shifts position and calls build_bus for each pin
-            """
-            alt_func_list:list[Pin] = []
-
-            def build_bus() -> None:
-                """Gets the alt_func_list and calls the build_pin for each pin number
-
-                Clear alt_func_list after pin creation
-                """
-                alt_func_list_single:list[Pin] = []
-
-                def build_pin() -> kicad.Pin:
-                    """Build a KiCad Pin object from alt_func_list_single and return
-                    Check valid pin len
-                    Clear alt_func_list after pin creation
-                    """
-                    vpr(f'build_pin(): alt_func_list_single={alt_func_list_single}',
-                        level=Verbosity.VERY_VERB)
-                    if not alt_func_list_single:
-                        raise LogicError(f'build_pin(): with empty alt_func_list_single!',
-                                         self.loc)
-                    # check pin number uniqueness
-                    p_n = alt_func_list_single[0].get_number()
-                    if p_n in pin_number_set:
-                        raise PinError(f'duplicate pin number {p_n}', alt_func_list_single[0].loc)
-                    pin_number_set.add(p_n)
-                    # check if pin len + padding is a integer multiple of grid
-                    p_len = alt_func_list_single[0].get_attr(PinHead.LEN)
-                    if (rot == 0) or (rot == 180):
-                        padding = self.attribs[SymHead.W_PADDING]
-                    else:
-                        padding = self.attribs[SymHead.H_PADDING]
-                    pin_pos = padding + p_len
-                    pin_pos_i = int(pin_pos)
-                    if pin_pos != pin_pos_i:
-                        raise SymbolError(f'Invalid pin_len: {p_len} padding: '
-                            f'{padding} combination in pin: '
-                            f'{alt_func_list_single[0].get_number()} Symbol {self.get_name()}',
-                            alt_func_list_single[0].loc)
-                    # shift pos
-                    nonlocal do_shift
-                    if do_shift:
-                        if not alt_func_list_single[0].is_stacked():
-                            shift_pos()
-                    do_shift = True
-                    # build kicad pin
-                    new_pin = build_kicad_pin(alt_func_list_single, posx, posy, rot)
-                    kicad_sym.pins.append(new_pin)
-                    return new_pin
-                
-                # build_bus
-                vpr(f'build_bus(): alt_func_list={alt_func_list}', level=Verbosity.VERY_VERB)
-                if not alt_func_list:
-                    raise LogicError(f'build_bus(): with empty alt_func_list!',
-                                     self.loc)
-                pin_num_list = alt_func_list[0].get_checked_bus_pin_list()
-                alt_funcs_name_schemas = []
-                alt_funcs_name_serial = []
-                for alt_func in alt_func_list:
-                    bbs = get_bus_build_schema(alt_func.get_name(), alt_func.loc)
-                    alt_funcs_name_schemas.append(bbs)
-                    alt_funcs_name_serial.append(bbs.start)
-
-                for pin_number in pin_num_list:
-                    alt_func_list_single.clear()
-                    i = 0
-                    for alt_func in alt_func_list:
-                        alt_func_pin_num_list = set(alt_func.get_checked_bus_pin_list())
-                        if pin_number in alt_func_pin_num_list:
-                            bus_pin = clone_bus_pin(alt_func, pin_number, 
-                                                alt_funcs_name_schemas[i].rex,
-                                                alt_funcs_name_serial[i])
-                            vpr(f'append to alt_func_list_single - Pin:{bus_pin}',
-                                level=Verbosity.VERY_VERB)
-                            alt_func_list_single.append(bus_pin)
-                            alt_funcs_name_serial[i] += alt_funcs_name_schemas[i].increment
-                        i += 1
-                    build_pin()
-                alt_func_list.clear()
-
-            # collect_alt_functions
-            vpr(f'collect_alt_functions(): {side_pin_list}', level=Verbosity.VERY_VERB)
-            for pin in side_pin_list:
-                vpr(f'collect_alt_functions: number: {pin.get_number()}',
-                    level=Verbosity.VERY_VERB)
-                if pin.is_gap():
-                    if alt_func_list:
-                        build_bus()
-                    count = pin.get_gap_count()
-                    while count > 0:
-                        shift_pos() # a sepatator or gap must shift the position
-                        count -= 1
-                else:
-                    if not alt_func_list:
-                        alt_func_list.append(pin)
-                    else:
-                        pin0 = alt_func_list[0]
-                        if not pin0.is_alt_func_pin(pin):
-                            # next physical pin
-                            build_bus()
-                            alt_func_list.append(pin)
-                        else:
-                            # alternative function - check for changes in other fields
-                            if pin.get_cat() != pin0.get_cat():
-                                raise LogicError(f'collect_alt_functions(): '
-                                f'Alternative list changes side!\n'
-                                f'pin: {pin} alt_func_list[-1]: {alt_func_list[-1]}',
-                                pin.loc)
-                            # finally append alternative function
-                            alt_func_list.append(pin)
-            # end side_pin_list
-            if alt_func_list:
-                build_bus()
-            return None
-
-        def inc_posx():
-            nonlocal posx
-            posx += 1
-        def dec_posy():
-            nonlocal posy
-            posy -= 1
-
-        # add_pins()
+        w_padding = self.attribs[SymHead.W_PADDING]
+        h_padding = self.attribs[SymHead.H_PADDING]
         # left pins
-        posx = (psp.width_h + self.attribs[SymHead.W_PADDING]) * -1
-        posy = psp.height_h - center_pins(psp.height_h, psp.pin_count_l)
-        rot = PinHead.SIDE_TO_ANGLE['left']
-        do_shift = False
-        the_side_list = \
-            [pin_item for pin_item in self.pins if pin_item.get_cat() == 'left']
-        collect_alt_functions(the_side_list, dec_posy)
+        state = PinBuildState(self, kicad_sym, pin_number_set,
+            posx = (psp.width_h + w_padding) * -1,
+            posy = psp.height_h - center_pins(psp.height_h, psp.pin_count_l),
+            rot = PinHead.SIDE_TO_ANGLE['left'], padding = w_padding,
+            horizontal = False)
+        collect_alt_functions(state, side_pins['left'])
 
         # right pins
-        posx = psp.width_h + self.attribs[SymHead.W_PADDING]
-        posy = psp.height_h - center_pins(psp.height_h, psp.pin_count_r)
-        rot = PinHead.SIDE_TO_ANGLE['right']
-        do_shift = False
-        the_side_list = \
-            [pin_item for pin_item in self.pins if pin_item.get_cat() == 'right']
-        collect_alt_functions(the_side_list, dec_posy)
+        state = PinBuildState(self, kicad_sym, pin_number_set,
+            posx = psp.width_h + w_padding,
+            posy = psp.height_h - center_pins(psp.height_h, psp.pin_count_r),
+            rot = PinHead.SIDE_TO_ANGLE['right'], padding = w_padding,
+            horizontal = False)
+        collect_alt_functions(state, side_pins['right'])
 
         # top pins
-        posx = (psp.width_h - center_pins(psp.width_h, psp.pin_count_t)) * -1
-        posy = psp.height_h + self.attribs[SymHead.H_PADDING]
-        rot = PinHead.SIDE_TO_ANGLE['top']
-        do_shift = False
-        the_side_list = \
-            [pin_item for pin_item in self.pins if pin_item.get_cat() == 'top']
-        collect_alt_functions(the_side_list, inc_posx)
+        state = PinBuildState(self, kicad_sym, pin_number_set,
+            posx = (psp.width_h - center_pins(psp.width_h, psp.pin_count_t)) * -1,
+            posy = psp.height_h + h_padding,
+            rot = PinHead.SIDE_TO_ANGLE['top'], padding = h_padding,
+            horizontal = True)
+        collect_alt_functions(state, side_pins['top'])
 
         # bottom pins
         #adjust = ((psp.width_h * 2) + 1 - psp.pin_count_b) // 2
-        posx = (psp.width_h - center_pins(psp.width_h, psp.pin_count_b)) * -1
-        posy = (psp.height_h + self.attribs[SymHead.H_PADDING]) * -1
-        rot = PinHead.SIDE_TO_ANGLE['bottom']
-        do_shift = False
-        the_side_list = \
-            [pin_item for pin_item in self.pins if pin_item.get_cat() == 'bottom']
-        collect_alt_functions(the_side_list, inc_posx)
+        state = PinBuildState(self, kicad_sym, pin_number_set,
+            posx = (psp.width_h - center_pins(psp.width_h, psp.pin_count_b)) * -1,
+            posy = (psp.height_h + h_padding) * -1,
+            rot = PinHead.SIDE_TO_ANGLE['bottom'], padding = h_padding,
+            horizontal = True)
+        collect_alt_functions(state, side_pins['bottom'])
+
+
+@dataclass(slots=True)
+class PinBuildState:
+    """State of the pin placement of one symbol side in build_all_pins.
+
+    posx, posy -- position of the next pin in pin grid units
+    rot        -- the pin rotation of the side
+    padding    -- the body padding perpendicular to the side
+    horizontal -- True: pins are placed from left to right, False: from top
+                  to bottom
+    do_shift   -- False until the first pin of the side is placed
+    """
+    symbol: Symbol
+    kicad_sym: kicad.KicadSymbol
+    pin_number_set: set[str]
+    posx: float
+    posy: float
+    rot: int
+    padding: float
+    horizontal: bool
+    do_shift: bool = False
+
+    def shift_pos(self) -> None:
+        if self.horizontal:
+            self.posx += 1
+        else:
+            self.posy -= 1
+
+
+def build_pin(state:PinBuildState, alt_func_list_single:list[Pin]) -> kicad.Pin:
+    """Build a KiCad Pin object from alt_func_list_single and return
+    Check valid pin len
+    Clear alt_func_list after pin creation
+    """
+    if very_verbose:
+        vpr(f'build_pin(): alt_func_list_single={alt_func_list_single}',
+            level=Verbosity.VERY_VERB)
+    if not alt_func_list_single:
+        raise LogicError(f'build_pin(): with empty alt_func_list_single!',
+                         state.symbol.loc)
+    pin0 = alt_func_list_single[0]
+    # check pin number uniqueness
+    p_n = pin0.number
+    if p_n in state.pin_number_set:
+        raise PinError(f'duplicate pin number {p_n}', pin0.loc)
+    state.pin_number_set.add(p_n)
+    # check if pin len + padding is a integer multiple of grid
+    p_len = pin0.get_attr(PinHead.LEN)
+    padding = state.padding
+    pin_pos = padding + p_len
+    pin_pos_i = int(pin_pos)
+    if pin_pos != pin_pos_i:
+        raise SymbolError(f'Invalid pin_len: {p_len} padding: '
+            f'{padding} combination in pin: '
+            f'{pin0.number} Symbol {state.symbol.get_name()}',
+            pin0.loc)
+    # shift pos
+    if state.do_shift:
+        if not pin0.is_stacked():
+            state.shift_pos()
+    state.do_shift = True
+    # build kicad pin
+    new_pin = build_kicad_pin(alt_func_list_single, state.posx, state.posy, state.rot)
+    state.kicad_sym.pins.append(new_pin)
+    return new_pin
+
+def build_bus(state:PinBuildState, alt_func_list:list[Pin]) -> None:
+    """Gets the alt_func_list and calls the build_pin for each pin number
+
+    Clear alt_func_list after pin creation
+    """
+    if very_verbose:
+        vpr(f'build_bus(): alt_func_list={alt_func_list}', level=Verbosity.VERY_VERB)
+    if not alt_func_list:
+        raise LogicError(f'build_bus(): with empty alt_func_list!',
+                         state.symbol.loc)
+    pin_num_list = alt_func_list[0].get_checked_bus_pin_list()
+    # per alternative function: pin, pin number set, name pattern, increment and
+    # the current serial number in a one element list
+    alt_funcs_state = []
+    for alt_func in alt_func_list:
+        bbs = get_bus_build_schema(alt_func.get_name(), alt_func.loc)
+        alt_funcs_state.append((alt_func, alt_func.get_bus_pin_set(),
+                                re.compile(bbs.rex) if bbs.rex else None,
+                                bbs.increment, [bbs.start]))
+
+    alt_func_list_single:list[Pin] = []
+    for pin_number in pin_num_list:
+        alt_func_list_single.clear()
+        for alt_func, alt_func_pin_set, pattern, increment, serial in alt_funcs_state:
+            if pin_number in alt_func_pin_set:
+                bus_pin = clone_bus_pin(alt_func, pin_number, pattern, serial[0])
+                if very_verbose:
+                    vpr(f'append to alt_func_list_single - Pin:{bus_pin}',
+                        level=Verbosity.VERY_VERB)
+                alt_func_list_single.append(bus_pin)
+                serial[0] += increment
+        build_pin(state, alt_func_list_single)
+    alt_func_list.clear()
+
+def collect_alt_functions(state:PinBuildState, side_pin_list:list[Pin]) -> None:
+    """Collect all associated alternative functions of one pin in alt_func_list
+    
+    Goes through side_pin_list, collects the alternative functions of a pin
+    in alt_func_list, shifts position and calls build_bus for each pin
+    """
+    alt_func_list:list[Pin] = []
+    if very_verbose:
+        vpr(f'collect_alt_functions(): {side_pin_list}', level=Verbosity.VERY_VERB)
+    for pin in side_pin_list:
+        if very_verbose:
+            vpr(f'collect_alt_functions: number: {pin.number}',
+                level=Verbosity.VERY_VERB)
+        if pin.is_gap():
+            if alt_func_list:
+                build_bus(state, alt_func_list)
+            for _ in range(pin.get_gap_count()):
+                state.shift_pos() # a sepatator or gap must shift the position
+        else:
+            if not alt_func_list:
+                alt_func_list.append(pin)
+            else:
+                pin0 = alt_func_list[0]
+                if not pin0.is_alt_func_pin(pin):
+                    # next physical pin
+                    build_bus(state, alt_func_list)
+                    alt_func_list.append(pin)
+                else:
+                    # alternative function - check for changes in other fields
+                    if pin.cat != pin0.cat:
+                        raise LogicError(f'collect_alt_functions(): '
+                        f'Alternative list changes side!\n'
+                        f'pin: {pin} alt_func_list[-1]: {alt_func_list[-1]}',
+                        pin.loc)
+                    # finally append alternative function
+                    alt_func_list.append(pin)
+    # end side_pin_list
+    if alt_func_list:
+        build_bus(state, alt_func_list)
 
 
 @dataclass
@@ -1183,16 +1348,19 @@ class SymbolProcessor:
     The instance of this class contains the results of the first
     line header analysis of the current csv-file:
         head_list -- a copy of the head line as list[str]
-        head_cols -- the assignement title -> column number as dict[int]"""
+        head_cols -- the assignement title -> column number as dict[int]
+        converters -- the assignement title -> value converter"""
     reader: MyCSVReader
     head_list: list = field(init=False)
-    head_cols: dict[str:int] = field(init=False)
+    head_cols: dict[str,int] = field(init=False)
+    converters: MappingProxyType[str,Converter] = field(init=False)
     pin_processor: PinProcessor = field(init=False)
-    symbols: dict[str:Symbol] = field(default_factory=dict)
+    symbols: dict[str,Symbol] = field(default_factory=dict)
 
     def __post_init__(self):
         self.head_list, self.head_cols = parse_header(
-            SymHead.COLUMNS_NEED, self.reader, True)
+            SymHead, self.reader, True)
+        self.converters = column_converters(SymHead)
         self.pin_processor = PinProcessor(self.reader)
 
     def add_symbol(self, sym:Symbol) -> None:
@@ -1204,7 +1372,8 @@ class SymbolProcessor:
     def get_symbol(self, name:str, loc:Location) -> Symbol:
         if name in self.symbols:
             sym = self.symbols[name]
-            vpr(f'get_symbol() returns: {sym}', level=Verbosity.VERY_VERB)
+            if very_verbose:
+                vpr(f'get_symbol() returns: {sym}', level=Verbosity.VERY_VERB)
             return sym
         else:
             raise SymbolError(f'Symbol {name!r} does not exist!', loc)
@@ -1223,22 +1392,20 @@ class SymbolProcessor:
         vpr(f'parse_symbol inp: {inp.columns!r}', level=Verbosity.VERBOSE)
         if inp.columns == Const.EOT:
             return inp, None
+        loc = inp.location
 
         if not isinstance(inp.columns, list):
-            raise LogicError(f'Wrong type in parse_symbol()!', inp.location)
+            raise LogicError(f'Wrong type in parse_symbol()!', loc)
         # check surplus data fields and data values with no header entry
-        i = 0
-        while(i < len(inp.columns)):
-            if i >= len(self.head_list):
-                raise SymbolError(f'Surplus symbol data fields: {inp.columns}',
-                                inp.location)
-            if not self.head_list[i] and inp.columns[i]:
-                raise SymbolError(f'Surplus symbol data field {inp.columns[i]!r}',
-                                inp.location)
-            i += 1
+        for head, value in zip(self.head_list, inp.columns):
+            if not head and value:
+                raise SymbolError(f'Surplus symbol data field {value!r}', loc)
+        if len(inp.columns) > len(self.head_list):
+            raise SymbolError(f'Surplus symbol data fields: {inp.columns}', loc)
         # parse all symbol columns in order: name, derived from, extends...
-        symbol: Symbol = Symbol(inp.location)
+        symbol: Symbol = Symbol(loc)
         derived_from: Optional[Symbol] = None
+        is_ext = False
         for item in SymHead.COLUMNS_NEED:
             # get value
             column = None
@@ -1246,10 +1413,11 @@ class SymbolProcessor:
             if item.name in self.head_cols:
                 column = self.head_cols[item.name]
                 value = inp.columns[column]
-            vpr(f'parse_symbol: item: {item} column: {column} value: {value!r}',
-                level=Verbosity.VERY_VERB)
+            if very_verbose:
+                vpr(f'parse_symbol: item: {item} column: {column} value: {value!r}',
+                    level=Verbosity.VERY_VERB)
             if (item.name == SymHead.DERIVE_FROM) and value:
-                derived_from = self.get_symbol(value, inp.location)
+                derived_from = self.get_symbol(value, loc)
                 symbol.set_derived(value)
             # try to get attribute from parent if no value
             derived_attr = None
@@ -1262,27 +1430,27 @@ class SymbolProcessor:
                 if not value:
                     if item.need == Need.VAL:
                         raise SymbolError(f'Value is required for {item.name!r}',
-                                        inp.location)
+                                        loc)
                 # check extension props
-                if symbol.is_extension():
+                if is_ext:
                     if value and not item.name in SymHead.EXTENSION_PROPS:
                         raise SymbolError(f'{item.name!r} is not allowed for extension '
-                                        f'symbols in symbol: {symbol.get_name()!r}', inp.location)
+                                        f'symbols in symbol: {symbol.get_name()!r}', loc)
                 # add defaults
                 if not value and (item.name in SymHead.DEFAULTS):
                     value = SymHead.DEFAULTS[item.name]
                 # add value to symbol
                 if value or (item.need != Need.OPT):
                     # Need.MAN and Need.VAL are always put
-                    va = convert_inp(value, item.name, SymHead.BOOL_FIELDS,
-                                        SymHead.INT_FIELDS, SymHead.FLOAT_FIELDS,
-                                        inp.location)
+                    va = self.converters[item.name](value, loc)
                     if (item.name in {SymHead.MIN_H, SymHead.MIN_W}) and value:
                         if va % 2:
                             raise SymbolError(f'{item.name} must be even. Value '
-                            f'is: {va} in symbol: {symbol.get_name()!r}', inp.location)
+                            f'is: {va} in symbol: {symbol.get_name()!r}', loc)
 
                     symbol.add_attr(item.name, va)
+            if item.name == SymHead.EXTENDS:
+                is_ext = symbol.is_extension()
         # get pins
         previous_pin = None
         previous_cat = ''
@@ -1297,7 +1465,7 @@ class SymbolProcessor:
                 vpr(f'parse_symbol returns: {symbol!r}', level=Verbosity.VERBOSE)
                 return new_inp, symbol
             # (more) pin(s) encountered
-            if symbol.is_extension():
+            if is_ext:
                 raise SymbolError(f'No pin definition allowed for a Derived symbol: '
                                 f'{symbol.get_name()!r}', new_inp.location)
             # get pin
@@ -1307,14 +1475,14 @@ class SymbolProcessor:
                 ov_pins.append(pin)
             else:
                 if pin.is_pseudo_pin():
-                    raise PinError(f'Pin Category: {pin.get_cat()!r} is not allowed '
+                    raise PinError(f'Pin Category: {pin.cat!r} is not allowed '
                                    f'for base symbols!', new_inp.location)
                 symbol.add_pin(pin)
             # keep previous pin when gap or pseudo-pin is encountered
             if not pin.is_gap() and not pin.is_pseudo_pin():
                 previous_pin = pin
             # save previous cat in any case
-            previous_cat = pin.get_cat()
+            previous_cat = pin.cat
 
 
 def overload_pins(symbol:Symbol, base_pins:list[Pin], derived_sym_pins:list[Pin]) -> None:
@@ -1322,6 +1490,45 @@ def overload_pins(symbol:Symbol, base_pins:list[Pin], derived_sym_pins:list[Pin]
     current_ovl_pin:Pin = None
     ovl_index = None
     new_pins:list[Pin] = base_pins.copy()
+    # The unprotected pins of new_pins by pin number tuple. Only these pins can
+    # start a match in get_clear_list. Built with the first lookup, which also
+    # checks the bus pin lists of all pins.
+    candidates:Optional[dict[Tuple[str,...],list[Pin]]] = None
+
+    def get_candidates(key:Tuple[str,...]) -> list[Pin]:
+        nonlocal candidates
+        if candidates is None:
+            candidates = {}
+            for pn in new_pins:
+                pn_key = pn.get_checked_bus_pin_list()
+                if not pn.is_protected():
+                    candidates.setdefault(pn_key, []).append(pn)
+        return candidates.get(key, [])
+
+    def delete_pins(del_list:list[int]) -> None:
+        """Delete the pins at the indexes in del_list (descending order)
+
+        Each run of adjacent indexes is removed with one slice deletion."""
+        i = 0
+        while i < len(del_list):
+            last = del_list[i]
+            first = last
+            i += 1
+            while (i < len(del_list)) and (del_list[i] == first - 1):
+                first -= 1
+                i += 1
+            if candidates is not None:
+                for pn in new_pins[first:last + 1]:
+                    if not pn.is_protected():
+                        candidates[pn.get_checked_bus_pin_list()].remove(pn)
+            del new_pins[first:last + 1]
+
+    def insert_pin(index:int, pn:Pin) -> None:
+        new_pins.insert(index, pn)
+        if candidates is not None:
+            pn_key = pn.get_checked_bus_pin_list()
+            if not pn.is_protected():
+                candidates.setdefault(pn_key, []).append(pn)
 
     def clear_index():
         nonlocal ins_index, current_ovl_pin, ovl_index
@@ -1331,11 +1538,22 @@ def overload_pins(symbol:Symbol, base_pins:list[Pin], derived_sym_pins:list[Pin]
 
     def get_clear_list(derived_pin:Pin) -> list[int]:
         my_list = []
-        idx = 0
+        if not new_pins:
+            return my_list
+        derived_list = derived_pin.get_checked_bus_pin_list()
+        matches = get_candidates(derived_list)
+        if not matches:
+            return my_list
+        # no match is possible before the first and after the last candidate
+        positions = [new_pins.index(pn) for pn in matches]
+        first = min(positions)
+        last = max(positions)
         alt_functs = False
-        for pn in new_pins:
+        for idx, pn in enumerate(islice(new_pins, first, None), first):
             if not alt_functs:
-                if derived_pin.get_checked_bus_pin_list() == pn.get_checked_bus_pin_list():
+                if idx > last:
+                    break
+                if derived_list == pn.get_checked_bus_pin_list():
                     if not pn.is_protected():
                         my_list.append(idx)
                         alt_functs = True
@@ -1344,73 +1562,75 @@ def overload_pins(symbol:Symbol, base_pins:list[Pin], derived_sym_pins:list[Pin]
                     my_list.append(idx)
                 else:
                     alt_functs = False
-            idx += 1
         return my_list
 
+    # The handlers of pseudo_pin_handlers share one signature and get the
+    # pseudo pin, even if they do not use it like handle_overload.
+    def handle_overload(pin:Pin) -> None:
+        clear_index()
+
+    def handle_delete(pin:Pin) -> None:
+        nonlocal ins_index
+        clear_index()
+        del_list = get_clear_list(pin)
+        if not del_list:
+            raise PinError(f'Pin number to delete not found! Number: {pin.number!r}',
+                            pin.loc)
+        ins_index = del_list[0]
+        del_list.reverse()
+        if very_verbose:
+            vpr(f'overload_pins(): Delete pins {del_list} Insert marker at {ins_index}',
+                level=Verbosity.VERY_VERB)
+        delete_pins(del_list)
+
+    def handle_insert(pin:Pin) -> None:
+        nonlocal ins_index
+        clear_index()
+        p_list = get_clear_list(pin)
+        if not p_list:
+            raise PinError(f'Pin number to insert not found! Number: {pin.number!r}',
+                           pin.loc)
+        if pin.cat == PinHead.BEFORE:
+            ins_index = p_list[0]
+        else:
+            ins_index = p_list[-1] + 1
+        if very_verbose:
+            vpr(f'overload_pins(): Insert marker at {ins_index}', level=Verbosity.VERY_VERB)
+
+    pseudo_pin_handlers = {PinHead.OVERLOAD: handle_overload,
+                           PinHead.DELETE: handle_delete,
+                           PinHead.BEFORE: handle_insert,
+                           PinHead.AFTER: handle_insert}
+
     for pin in derived_sym_pins:
-        p_num = pin.get_number()
+        p_num = pin.number
         if pin.is_pseudo_pin():
-            category = pin.get_cat()
-            if category == PinHead.OVERLOAD:
-                clear_index()
-            elif category == PinHead.DELETE:
-                clear_index()
-                del_list = get_clear_list(pin)
-                if not del_list:
-                    raise PinError(f'Pin number to delete not found! Number: {p_num!r}',
-                                    pin.loc)
-                ins_index = del_list[0]
-                del_list.reverse()
-                vpr(f'overload_pins(): Delete pins {del_list} Insert marker at {ins_index}',
-                    level=Verbosity.VERY_VERB)
-                for x in del_list:
-                    del new_pins[x]
-            elif (category == PinHead.BEFORE) or (category == PinHead.AFTER):
-                clear_index()
-                p_list = []
-                idx = 0
-                alt_functs = False
-                for pn in new_pins:
-                    if not alt_functs:
-                        if pin.get_checked_bus_pin_list() == pn.get_checked_bus_pin_list():
-                            if not pn.is_protected():
-                                p_list.append(idx)
-                                alt_functs = True
-                    else:
-                        if pin.is_alt_func_pin(pn):
-                            p_list.append(idx)
-                        else:
-                            alt_functs = False
-                    idx += 1
-                if not p_list:
-                    raise PinError(f'Pin number to insert not found! Number: {p_num!r}',
-                                   pin.loc)
-                if category == PinHead.BEFORE:
-                    ins_index = p_list[0]
-                else:
-                    ins_index = p_list[-1] + 1
-                vpr(f'overload_pins(): Insert marker at {ins_index}', level=Verbosity.VERY_VERB)
-            else:
-                raise LogicError(f'Invalide overwrite operation: {category!r}', pin.loc)
+            handler = pseudo_pin_handlers.get(pin.cat)
+            if handler is None:
+                raise LogicError(f'Invalide overwrite operation: {pin.cat!r}', pin.loc)
+            handler(pin)
         else:
             if not ins_index is None:
-                vpr(f'overload_pins(): Insert pin {p_num!r} at index {ins_index}',
-                    level=Verbosity.VERY_VERB)
+                if very_verbose:
+                    vpr(f'overload_pins(): Insert pin {p_num!r} at index {ins_index}',
+                        level=Verbosity.VERY_VERB)
                 pin.set_protected(True)
-                new_pins.insert(ins_index, pin)
+                insert_pin(ins_index, pin)
                 ins_index += 1
             else:
                 done = False
                 if not ovl_index is None:
                     if current_ovl_pin.is_alt_func_pin(pin):
-                        vpr(f'overload_pins(): Overload: insert pin {p_num!r} at index {ovl_index}',
-                            level=Verbosity.VERY_VERB)
-                        new_pins.insert(ovl_index, pin)
+                        if very_verbose:
+                            vpr(f'overload_pins(): Overload: insert pin {p_num!r} at index {ovl_index}',
+                                level=Verbosity.VERY_VERB)
+                        insert_pin(ovl_index, pin)
                         ovl_index += 1
                         done = True
                     else:
-                        vpr(f'overload_pins(): Overload: end alt func list. New pin {p_num!r}',
-                            level=Verbosity.VERY_VERB)
+                        if very_verbose:
+                            vpr(f'overload_pins(): Overload: end alt func list. New pin {p_num!r}',
+                                level=Verbosity.VERY_VERB)
                         clear_index()
                 if not done:
                     del_list = get_clear_list(pin)
@@ -1420,25 +1640,26 @@ def overload_pins(symbol:Symbol, base_pins:list[Pin], derived_sym_pins:list[Pin]
                     ovl_index = del_list[0]
                     current_ovl_pin = pin
                     del_list.reverse()
-                    vpr(f'overload_pins(): Overload: delete pins {del_list}', level=Verbosity.VERY_VERB)
-                    for x in del_list:
-                        del new_pins[x]
-                    vpr(f'overload_pins(): Overload: insert pin {p_num!r} at index {ovl_index}',
-                        level=Verbosity.VERY_VERB)
-                    new_pins.insert(ovl_index, pin)
+                    if very_verbose:
+                        vpr(f'overload_pins(): Overload: delete pins {del_list}', level=Verbosity.VERY_VERB)
+                    delete_pins(del_list)
+                    if very_verbose:
+                        vpr(f'overload_pins(): Overload: insert pin {p_num!r} at index {ovl_index}',
+                            level=Verbosity.VERY_VERB)
+                    insert_pin(ovl_index, pin)
                     ovl_index += 1
     for np in new_pins:
         np.set_protected(False)
     symbol.pins = new_pins
 
 
-def parse_header(head_prop:list[ColumnProp], reader:MyCSVReader,
-                 is_first_line:bool) -> Tuple[list[str], dict[str:int]]:
+def parse_header(head:type, reader:MyCSVReader,
+                 is_first_line:bool) -> Tuple[list[str], dict[str,int]]:
     """Get one record from csvreader and return valid header list and name-column-dict.
 
     The headlines are case insensitive and the items are stripped.
     Arguments:
-      head_prop -- header property list for the current header
+      head      -- the head class of the current header SymHead or PinHead
       reader    -- reader object for the current file
       is_first_line -- is it the first line to parse?
     Globals:
@@ -1448,10 +1669,19 @@ def parse_header(head_prop:list[ColumnProp], reader:MyCSVReader,
     Throws: HeaderError, csv.Error, StopIteration
     """
     csv_record = reader.get_record()
-    l_record = [item.lower() for item in csv_record.columns] 
+    l_record = [sys.intern(item.lower()) for item in csv_record.columns]
     vpr(f'parse_header: inp: {csv_record.columns}', level=Verbosity.VERBOSE)
-    # fieldset: set of non empty fields
-    fieldset = set([item for item in l_record if item])
+    # heading_cols: column index of the non empty fields; fieldset: the field names
+    heading_cols = {}
+    double_field = None
+    for col_index, col_name in enumerate(l_record):
+        if col_name:
+            if col_name in heading_cols:
+                if double_field is None:
+                    double_field = col_name
+            else:
+                heading_cols[col_name] = col_index
+    fieldset = set(heading_cols)
     vpr(f'field_set: {fieldset}', level=Verbosity.VERBOSE)
     #check the first column
     if is_first_line:
@@ -1463,33 +1693,28 @@ def parse_header(head_prop:list[ColumnProp], reader:MyCSVReader,
             raise HeaderError('Column 0 in the second line header must be empty!',
                               csv_record.location)
     # check double entries
-    for val in fieldset:
-        count = l_record.count(val)
-        if count > 1:
-            raise HeaderError(f'Column: {val!r} exists more than once in header:\n'
-                              f'{csv_record.columns}', csv_record.location)
+    if double_field is not None:
+        raise HeaderError(f'Column: {double_field!r} exists more than once in header:\n'
+                          f'{csv_record.columns}', csv_record.location)
     # check presence of all required fields
-    required_header_fields = {item.name for item in head_prop \
-                        if (item.need == Need.VAL) or (item.need == Need.MAN)}
-    vpr(f'required_header_fields: {required_header_fields}', level=Verbosity.VERY_VERB)
+    required_header_fields, all_header_field_set = header_field_sets(head)
+    if very_verbose:
+        vpr(f'required_header_fields: {sorted(required_header_fields)}',
+            level=Verbosity.VERY_VERB)
     if not fieldset >= required_header_fields:
         missing_header_fields = required_header_fields - fieldset
         raise HeaderError(f'Headline: {csv_record.columns}\n'
           f'misses required fields: {[item for item in missing_header_fields]}',
           csv_record.location)
     # check presence of surplus fields
-    all_header_field_set = {item for item, need in head_prop}
-    vpr(f'all_header_field_set: {all_header_field_set}', level=Verbosity.VERY_VERB)
+    if very_verbose:
+        vpr(f'all_header_field_set: {sorted(all_header_field_set)}',
+            level=Verbosity.VERY_VERB)
     surplus_header_field_set = fieldset - all_header_field_set
     if surplus_header_field_set:
         raise HeaderError(f'Headline: {csv_record.columns}\n'
           f'has surplus fields: {[item for item in surplus_header_field_set]}',
           csv_record.location)
-    # build return values
-    heading_cols = {}
-    for col_index, col_name in enumerate(l_record):
-        if col_name:
-            heading_cols[col_name] = col_index
     vpr(f'parse_header: return l_record: {l_record}', level=Verbosity.VERBOSE)
     vpr(f'parse_header: return head_cols: {heading_cols}', level=Verbosity.VERBOSE)
     return l_record, heading_cols
@@ -1500,10 +1725,7 @@ def get_half_len(pin_count:int) -> int:
       lgh = (p - 1) / 2 if p is odd
       lgh = P / 2 if p is even
     """
-    if pin_count % 2:
-        return (pin_count - 1) // 2
-    else:
-        return pin_count // 2
+    return pin_count // 2
 
 
 def center_pins(half_len:int, pin_count:int) -> int:
@@ -1517,64 +1739,64 @@ def center_pins(half_len:int, pin_count:int) -> int:
         pin_count_max = half_len * 2 + 1
     Start pos is:
         st =  (pin_count_max - pin_count) / 2
-    Round up for even pin counts
+    Round up for even pin counts, which is the same as:
+        st = half_len - (pin_count - 1) // 2
     """
-    res = ((half_len * 2) + 1 - pin_count) // 2
-    if not pin_count % 2:
-        res += 1
-    return res
+    return half_len - (pin_count - 1) // 2
 
 
 def build_kicad_pin(alt_func_list:list[Pin], posx:float, posy:float, rot:float) \
     -> kicad.Pin:
     """Build a KiCad Pin object from alt_func_list and return"""
-    vpr(f'build_pin: alt_func_list: {alt_func_list}', level=Verbosity.VERY_VERB)
+    if very_verbose:
+        vpr(f'build_pin: alt_func_list: {alt_func_list}', level=Verbosity.VERY_VERB)
     pin0 = alt_func_list[0]
     loc = pin0.loc
     hidden = pin0.is_hidden()
-    pin_len = pin0.get_attr(PinHead.LEN)
-    pin_len_mm = kicad.mil_to_mm(pin_len)
+    # read the pin columns directly from the slots; the defaults are already
+    # resolved by the pin processor
+    pin_len = pin0.length
+    el_type = pin0.el_type
+    gr_type = pin0.gr_type
+    number_font_size = pin0.number_font_size # mils
+    name_font_size = pin0.name_font_size # mils
+    if (pin_len is None) or (el_type is None) or (gr_type is None) \
+            or (number_font_size is None) or (name_font_size is None):
+        raise LogicError(f'Missing attribute in pin: {pin0}', loc)
     if hidden:
         pin_len = 0
     posx_mm = posx * Const.GRID
     posy_mm = posy * Const.GRID
     pin_len_mm = pin_len * Const.GRID
     #TODO: check valid pin pos
-    if rot == 0:
-        posx_mm -= pin_len_mm
-    elif rot == 180:
-        posx_mm += pin_len_mm
-    elif rot == 270:
-        posy_mm += pin_len_mm
-    elif rot == 90:
-        posy_mm -= pin_len_mm
-    else:
+    offset = PinHead.ANGLE_TO_OFFSET.get(rot)
+    if offset is None:
         raise LogicError(f'Wrong rot: {rot} in pin: {pin0}', loc)
-    vpr(f'build_pin: number: {pin0.get_number()} '
+    posx_mm += offset[0] * pin_len_mm
+    posy_mm += offset[1] * pin_len_mm
+    vpr(f'build_pin: number: {pin0.number} '
         f'name={pin0.get_name()} posx: {posx} posy: {posy} '
         f'pin_len: {pin_len_mm} rot: {rot}', level=Verbosity.VERBOSE)
     new_pin = kicad.Pin(
-        number=pin0.get_number(), name=pin0.get_name(),
-        etype=pin0.get_attr(PinHead.EL_TYPE), shape=pin0.get_attr(PinHead.GR_TYPE),
+        number=pin0.number, name=pin0.get_name(),
+        etype=el_type, shape=gr_type,
         posx=posx_mm, posy=posy_mm, length=pin_len_mm, rotation=rot,
         is_hidden=hidden)
-    number_font_size = pin0.get_attr(PinHead.NUMBER_FONT_SIZE) # mils
     n_mm = kicad.mil_to_mm(number_font_size)
     new_pin.number_effect.sizex = n_mm
     new_pin.number_effect.sizey = n_mm
-    name_font_size = pin0.get_attr(PinHead.NAME_FONT_SIZE) # mils
     n_mm = kicad.mil_to_mm(name_font_size)
     new_pin.name_effect.sizex = n_mm
     new_pin.name_effect.sizey = n_mm
     # append alternative functions
-    i = 1
-    while i < len(alt_func_list):
-        new_alt_func = kicad.AltFunction(
-            name  = alt_func_list[i].get_name(),
-            etype = alt_func_list[i].get_attr(PinHead.EL_TYPE),
-            shape = alt_func_list[i].get_attr(PinHead.GR_TYPE))
-        new_pin.altfuncs.append(new_alt_func)
-        i += 1
+    altfuncs = new_pin.altfuncs
+    for alt_func in alt_func_list[1:]:
+        if (alt_func.el_type is None) or (alt_func.gr_type is None):
+            raise LogicError(f'Missing attribute in pin: {alt_func}', alt_func.loc)
+        altfuncs.append(kicad.AltFunction(
+            name  = alt_func.get_name(),
+            etype = alt_func.el_type,
+            shape = alt_func.gr_type))
     return new_pin
 
 
@@ -1610,12 +1832,17 @@ class KicadLibWrapper:
         self.lib.write()
 
 vpr = None
+# Guards the very verbose messages in the per pin, per column and overload
+# code paths, so that their arguments are not formatted if not printed.
+very_verbose = False
 
 def main():
     """Parse csv input files and produce one kicat symbolfile"""
     arguments = parse_arguments()
-    global vpr
+    global vpr, very_verbose
     vpr = verbose_print_fact(arguments.verbose, arguments.silent)
+    very_verbose = (not arguments.silent
+                    and arguments.verbose >= Verbosity.VERY_VERB.value)
     vpr(f'arguments: {arguments}', level=Verbosity.VERBOSE)
 
     inp_file_errors = 0
@@ -1629,51 +1856,49 @@ def main():
     else:
         libname = arguments.output[0]
     kicad_lib = KicadLibWrapper(libname)
-    vpr(f'Create kicad_lib: {kicad_lib.get_filename()}')
+    lib_filename = kicad_lib.get_filename()
+    vpr(f'Create kicad_lib: {lib_filename}')
 
     for inputfile in arguments.inputfiles:
         inp_files_processed += 1
         try:
             vpr(f'Open: {inputfile!r}')
-            with open(inputfile, mode='rt', newline='') as csvfile:
+            with open(inputfile, mode='rt', newline='', buffering=CSV_READ_BUFFER) as csvfile:
                 reader = MyCSVReader(inputfile, csvfile,
                                      dialect=arguments.csv_dialect[0], strict=True)
 
                 sym_proc = SymbolProcessor(reader)
 
-                csv_rec = CSVRecord(None, reader.get_location())
+                # None: the next record must be read from the file
+                csv_rec:Optional[CSVRecord] = None
                 skipped_pins = 0
                 failures = 0
                 symbol_count = 0
-                while (csv_rec.columns == None) or (csv_rec.columns != Const.EOT):
+                while (csv_rec is None) or (csv_rec.columns != Const.EOT):
                     new_csv_rec = None
                     try:
-                        if csv_rec.columns == None:
+                        if csv_rec is None:
                             csv_rec = reader.get_nonempty_line()
                         # skip pin lines
-                        while (csv_rec.columns != Const.EOT) and (not csv_rec.columns[0]):
-                            skipped_pins += 1
-                            csv_rec = reader.get_nonempty_line()
-                            vpr(f'main loop skip line inp: {csv_rec.columns}',
-                                level=Verbosity.VERY_VERB)
+                        if (csv_rec.columns != Const.EOT) and (not csv_rec.columns[0]):
+                            csv_rec, skipped = reader.get_nonpin_line()
+                            skipped_pins += 1 + skipped
+                            if very_verbose:
+                                vpr(f'main loop skipped {1 + skipped} pin line(s) '
+                                    f'inp: {csv_rec.columns}', level=Verbosity.VERY_VERB)
                         new_csv_rec, symbol = sym_proc.parse_symbol(csv_rec)
                         if symbol:
-                            kicad_symbol = symbol.build_symbol(
-                                kicad_lib.get_filename(), kicad_lib.lib)
+                            kicad_symbol = symbol.build_symbol(lib_filename, kicad_lib.lib)
                             kicad_lib.add_symbol(kicad_symbol, symbol.loc)
                             symbol_count += 1
                     except (PinError, SymbolError, ValidationError) as error:
                         failures += 1
                         print(error.__class__.__name__, error, file=sys.stderr)
-                        if new_csv_rec is None:
-                            new_csv_rec = CSVRecord(None, reader.get_location())
-                    if new_csv_rec is None:
-                        raise LogicError(f'main: new_csv_rec is None!', csv_rec.location)
                     csv_rec = new_csv_rec
 
                 vpr(f'End file: {inputfile!r} ',
-                    f'{csv_rec.location.line} line(s) processed. ',
-                    f'{csv_rec.location.record} record(s) processed. '
+                    f'{csv_rec.line} line(s) processed. ',
+                    f'{csv_rec.record} record(s) processed. '
                     f'{reader.skipped_empty} empty/comment record(s) skipped. '
                     f'{symbol_count} symbol(s) generated. '
                     f'{skipped_pins} pin record(s) skipped. '
@@ -1693,13 +1918,13 @@ def main():
             print(error.__class__.__name__, error, file=sys.stderr)
 
     # generate output lib
-    vpr(f'Write to kicad_lib: {kicad_lib.get_filename()}')
+    vpr(f'Write to kicad_lib: {lib_filename}')
     kicad_lib.generate()
 
     if not inp_file_errors and not all_skipped_pins and not all_failures:
         vpr(f'Success all done. {inp_files_processed} input file(s) processed.\n'
             f'{kicad_lib.get_symbol_count()} symbols in library '
-            f'{kicad_lib.get_filename()} generated.')
+            f'{lib_filename} generated.')
         vpr(f'Symbols: {kicad_lib.symbol_names}', level=Verbosity.VERBOSE)
         exit(0)
     else:
@@ -1708,7 +1933,7 @@ def main():
             f'Failures: {all_failures}',
              file=sys.stderr)
         vpr(f'{kicad_lib.get_symbol_count()} symbols in library '
-            f'{kicad_lib.get_filename()} generated.')
+            f'{lib_filename} generated.')
         vpr(f'Symbols: {kicad_lib.symbol_names}', level=Verbosity.VERBOSE)
         exit(3)
 